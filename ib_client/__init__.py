@@ -24,6 +24,7 @@ from .trading.orders import (
 # Scanner adapters
 from .scanners.scanner import ScannerAdapter, ScanResult, ScanRequest
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -73,12 +74,24 @@ class IBClient:
             self.accounts, self.portfolio, self.pnl,
             self.market_data, self.orders, self.scanner
         ]
-        
-        for adapter in adapters:
-            try:
-                await adapter.logout()
-            except Exception as e:
-                logger.warning(f"Error during logout for {adapter.__class__.__name__}: {e}")
+
+        results = await asyncio.gather(
+            *(adapter.logout() for adapter in adapters),
+            return_exceptions=True
+        )
+        for adapter, result in zip(adapters, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error during logout for {adapter.__class__.__name__}: {result}")
+
+        # Release pooled HTTP connections once all adapters are done
+        from .core.http import aclose
+        await aclose()
+
+    async def __aenter__(self) -> "IBClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.logout()
 
 # Legacy support - maintain backwards compatibility with existing ib_adapter.py
 from pydantic import BaseModel
@@ -88,6 +101,9 @@ class Contract(BaseModel):
     symbol: str
     exchange: str
 
+# Exchanges preferred when several contracts match a symbol
+_PREFERRED_EXCHANGES = frozenset(("NASDAQ", "SMART"))
+
 async def search_contract(symbol: str, sec_type: str = "STK") -> Contract:
     """
     Legacy function for contract search.
@@ -98,7 +114,7 @@ async def search_contract(symbol: str, sec_type: str = "STK") -> Contract:
     from .core.http import _get
     
     try:
-        data = await _get("/iserver/secdef/search", symbol=symbol, secType=sec_type)
+        data = await _get("/iserver/secdef/search", params={"symbol": symbol, "secType": sec_type})
     except Exception as e:
         raise ValueError(f"API request failed for symbol {symbol}: {str(e)}")
     
@@ -108,25 +124,33 @@ async def search_contract(symbol: str, sec_type: str = "STK") -> Contract:
     # Handle case where data is not a list or contains no valid items
     if not isinstance(data, list):
         raise ValueError(f"Invalid API response format for symbol: {symbol}")
-    
-    # Filter out non-dict items and find best exchange
-    valid_contracts = [x for x in data if isinstance(x, dict) and 'conid' in x]
-    if not valid_contracts:
+
+    # Single pass: remember the first valid contract, stop at a preferred exchange
+    first_valid = best = None
+    for x in data:
+        if not isinstance(x, dict) or 'conid' not in x:
+            continue
+        if first_valid is None:
+            first_valid = x
+        if x.get("exchange") in _PREFERRED_EXCHANGES:
+            best = x
+            break
+
+    if first_valid is None:
         raise ValueError(f"No valid contract data found for symbol: {symbol}")
-        
+
     try:
-        best = next((x for x in valid_contracts if x.get("exchange") in ("NASDAQ", "SMART")), None)
-        if not best:
-            best = valid_contracts[0]
+        if best is None:
+            best = first_valid
             if "exchange" not in best:
                 best["exchange"] = "UNKNOWN"
-        
+
         # Ensure required fields exist
         if 'conid' not in best or 'symbol' not in best:
             raise ValueError(f"Incomplete contract data for symbol: {symbol}")
-            
+
         return Contract(**best)
-        
+
     except (TypeError, KeyError) as e:
         raise ValueError(f"Invalid contract data structure for symbol {symbol}: {str(e)}")
 
@@ -137,7 +161,7 @@ async def historical(conid: int, bar: str, period: str):
     """
     from .core.http import _get
     return await _get("/iserver/marketdata/history",
-                      conid=conid, bar=bar, period=period, outsideRth="true")
+                      params={"conid": conid, "bar": bar, "period": period, "outsideRth": "true"})
 
 # Main exports
 __all__ = [
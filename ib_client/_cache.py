@@ -0,0 +1,51 @@
+"""
+Small file-backed JSON cache used by the demo scripts.
+
+Keeps demo reruns from re-fetching identical historical bars and account
+summaries: entries are keyed by the request parameters and expire after a
+TTL, so repeated runs (and offline/CI runs with a warm cache) skip the
+network entirely.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """JSON file cache with per-entry TTL, keyed by request parameters"""
+
+    def __init__(self, cache_dir: str = ".cache", ttl: float = 3600.0):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, params: dict) -> Path:
+        key = hashlib.md5(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, params: dict, ttl: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value for params, or None if missing/expired"""
+        path = self._path(params)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("ts", 0) > (ttl if ttl is not None else self.ttl):
+            return None
+        return entry.get("data")
+
+    def set(self, params: dict, data: Any) -> None:
+        """Store data for params; cache failures are logged, never raised"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._path(params), "w") as f:
+                json.dump({"ts": time.time(), "data": data}, f, default=str)
+        except OSError as e:
+            logger.warning(f"Cache write failed: {e}")
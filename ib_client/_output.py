@@ -0,0 +1,25 @@
+"""Per-task stdout capture for demo suites that run their steps concurrently."""
+
+import contextvars
+import io
+from typing import Optional
+
+# Each gathered demo sets this to its own buffer so concurrently running
+# demos don't interleave their tables; output is replayed in order after
+# the gather completes
+CAPTURE: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar("CAPTURE", default=None)
+
+class StdoutRouter:
+    """Routes writes to the current task's capture buffer, if any"""
+
+    def __init__(self, real):
+        self._real = real
+
+    def write(self, s):
+        buf = CAPTURE.get()
+        return (buf if buf is not None else self._real).write(s)
+
+    def flush(self):
+        buf = CAPTURE.get()
+        if buf is None:
+            self._real.flush()
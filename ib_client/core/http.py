@@ -2,15 +2,62 @@ import ssl
 import httpx
 import os
 import asyncio
+import json as _json
+from decimal import Decimal
 from typing import Any, Dict, Optional
 from httpx import Response
 import logging
 
+try:
+    import orjson
+except ImportError:  # fall back to httpx's stdlib json decoding
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 multiplexing in httpx
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 logger = logging.getLogger(__name__)
 
+# Header set for pre-encoded JSON bodies sent via the content= path
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 BASE = os.getenv("IB_BASE", "https://localhost:8765/v1/api")
 CTX = ssl._create_unverified_context()  # ignore self-signed cert
 
+# Shared client so connections are pooled and kept alive across calls
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOCK = asyncio.Lock()
+_http_version_logged = False
+
+async def _get_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it lazily on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        async with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.AsyncClient(
+                    verify=CTX,
+                    http2=_HTTP2,
+                    timeout=httpx.Timeout(30.0),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=32,
+                        max_connections=64,
+                        keepalive_expiry=30.0
+                    )
+                )
+    return _CLIENT
+
+async def aclose() -> None:
+    """Close the shared client and release pooled connections"""
+    global _CLIENT
+    async with _CLIENT_LOCK:
+        client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
+
 class IBAPIError(Exception):
     """Base exception for IB API errors"""
     def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None):
@@ -23,61 +70,119 @@ async def _request_with_retry(
     path: str,
     max_retries: int = 3,
     retry_delay: float = 1.0,
-    **kwargs
-) -> Dict[str, Any]:
-    """Make HTTP request with automatic retries"""
-    
+    decode_type: Optional[Any] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Dict[str, Any]] = None,
+    content: Optional[bytes] = None,
+    decimal: bool = False
+) -> Any:
+    """
+    Make HTTP request with automatic retries.
+
+    Response bodies decode through orjson when it is installed (one
+    C-level pass over the raw bytes), falling back to httpx's stdlib
+    json; every adapter built on _get/_post shares this path.
+
+    When decode_type (a pydantic TypeAdapter) is given, the response body is
+    validated straight from bytes into typed objects in one pass, skipping
+    the intermediate dict tree. Falls back to raw JSON on validation errors.
+
+    With decimal=True, numeric JSON tokens are decoded directly to Decimal -
+    no lossy float round trip - for money-bearing endpoints.
+
+    content, when given, is a pre-encoded JSON body sent verbatim; callers
+    that cache serialized payloads skip re-encoding on every request.
+    """
+
+    client = await _get_client()
+
+    # Encode dict bodies with orjson up front when it is installed, instead
+    # of httpx running stdlib json.dumps inside every attempt; default=str
+    # covers Decimal and datetime values
+    if content is None and json is not None and orjson is not None:
+        content = orjson.dumps(json, default=str)
+        json = None
+
     for attempt in range(max_retries + 1):
+        backoff = min(retry_delay * (2 ** attempt), 30.0)
         try:
-            async with httpx.AsyncClient(verify=False, timeout=30.0) as client:
-                response = await client.request(method, f"{BASE}{path}", **kwargs)
-                
-                # Handle different response scenarios
-                if response.status_code == 401:
-                    raise IBAPIError("Authentication required", status_code=401)
-                elif response.status_code == 403:
-                    raise IBAPIError("Access forbidden", status_code=403)
-                elif response.status_code >= 500:
-                    if attempt < max_retries:
-                        logger.warning(f"Server error {response.status_code}, retrying in {retry_delay}s...")
-                        await asyncio.sleep(retry_delay * (2 ** attempt))
-                        continue
-                    raise IBAPIError(f"Server error: {response.status_code}", status_code=response.status_code)
-                
-                response.raise_for_status()
-                
-                # Handle empty responses
-                if not response.content:
-                    return {}
-                    
-                return response.json()
-                
+            if content is not None:
+                response = await client.request(method, f"{BASE}{path}", params=params,
+                                                content=content, headers=_JSON_HEADERS)
+            else:
+                response = await client.request(method, f"{BASE}{path}", params=params, json=json)
+
+            global _http_version_logged
+            if not _http_version_logged:
+                logger.debug(f"IB gateway connection negotiated {response.http_version}")
+                _http_version_logged = True
+
+            # Handle different response scenarios
+            if response.status_code == 401:
+                raise IBAPIError("Authentication required", status_code=401)
+            elif response.status_code == 403:
+                raise IBAPIError("Access forbidden", status_code=403)
+            elif response.status_code >= 500:
+                if attempt < max_retries:
+                    logger.warning(f"Server error {response.status_code}, retrying in {backoff}s...")
+                    await asyncio.sleep(backoff)
+                    continue
+                raise IBAPIError(f"Server error: {response.status_code}", status_code=response.status_code)
+
+            response.raise_for_status()
+
+            # Handle empty responses
+            if not response.content:
+                return {}
+
+            if decimal:
+                # stdlib decoder: only it can hand numeric tokens to Decimal
+                return _json.loads(response.content, parse_float=Decimal)
+
+            if decode_type is not None:
+                try:
+                    return decode_type.validate_json(response.content)
+                except Exception as e:
+                    logger.warning(f"Typed decode failed for {path}, falling back to raw JSON: {e}")
+
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+
+        except (httpx.RemoteProtocolError, httpx.ConnectError) as e:
+            # Pooled connection went stale - reset the client before retrying
+            await aclose()
+            if attempt < max_retries:
+                logger.warning(f"Connection error: {e}, resetting client and retrying in {backoff}s...")
+                await asyncio.sleep(backoff)
+                client = await _get_client()
+                continue
+            raise IBAPIError(f"Request failed after {max_retries} retries: {e}")
         except httpx.RequestError as e:
             if attempt < max_retries:
-                logger.warning(f"Request failed: {e}, retrying in {retry_delay}s...")
-                await asyncio.sleep(retry_delay * (2 ** attempt))
+                logger.warning(f"Request failed: {e}, retrying in {backoff}s...")
+                await asyncio.sleep(backoff)
                 continue
             raise IBAPIError(f"Request failed after {max_retries} retries: {e}")
         except Exception as e:
             if attempt < max_retries and "timeout" in str(e).lower():
-                logger.warning(f"Timeout error, retrying in {retry_delay}s...")
-                await asyncio.sleep(retry_delay * (2 ** attempt))
+                logger.warning(f"Timeout error, retrying in {backoff}s...")
+                await asyncio.sleep(backoff)
                 continue
             raise
     
     raise IBAPIError(f"Max retries ({max_retries}) exceeded")
 
-async def _get(path: str, **params) -> Dict[str, Any]:
+async def _get(path: str, params: Optional[Dict[str, Any]] = None, decode_type: Optional[Any] = None,
+               decimal: bool = False) -> Any:
     """GET request with retry logic"""
-    return await _request_with_retry("GET", path, params=params)
+    return await _request_with_retry("GET", path, decode_type=decode_type, params=params, decimal=decimal)
 
-async def _post(path: str, json_data: Optional[Dict] = None, **params) -> Dict[str, Any]:
-    """POST request with retry logic"""
-    kwargs = {"params": params}
-    if json_data:
-        kwargs["json"] = json_data
-    return await _request_with_retry("POST", path, **kwargs)
+async def _post(path: str, json_data: Optional[Dict] = None, params: Optional[Dict[str, Any]] = None,
+                content: Optional[bytes] = None) -> Dict[str, Any]:
+    """POST request with retry logic; content takes a pre-encoded JSON body"""
+    return await _request_with_retry("POST", path, params=params, json=json_data, content=content)
 
-async def _delete(path: str, **params) -> Dict[str, Any]:
+async def _delete(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """DELETE request with retry logic"""
     return await _request_with_retry("DELETE", path, params=params) 
\ No newline at end of file
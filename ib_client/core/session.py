@@ -8,52 +8,99 @@ from .http import _get, _post, IBAPIError
 
 logger = logging.getLogger(__name__)
 
+class _AuthState:
+    """
+    Process-wide authentication state shared by all adapters.
+    Collapses concurrent auth checks into a single request and keeps
+    one cached status + one keep-alive loop for the whole process.
+    """
+
+    def __init__(self):
+        self.status: Optional[Dict] = None
+        self.expires_at: float = 0.0
+        self.inflight: Optional[asyncio.Future] = None
+        self.reauth_inflight: Optional[asyncio.Future] = None
+        self.lock = asyncio.Lock()
+        self.keep_alive_task: Optional[asyncio.Task] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached status so the next check hits the API"""
+        self.status = None
+        self.expires_at = 0.0
+
+_AUTH_STATE = _AuthState()
+
 class SessionAdapter:
     """
     Mixin class that provides session management functionality.
     All other adapters should inherit from this to ensure proper authentication.
     """
-    
+
     def __init__(self):
-        self._session_status: Optional[Dict] = None
-        self._last_auth_check: Optional[float] = None
         self._auth_check_interval = 300  # 5 minutes
-        self._keep_alive_task: Optional[asyncio.Task] = None
         self._keep_alive_interval = 60  # 1 minute
-        self._session_lock = asyncio.Lock()
-    
+
     async def _ensure_live(self) -> None:
         """
         Ensure the session is authenticated and active.
         This should be called before any API operation.
         """
-        async with self._session_lock:
-            current_time = time.time()
-            
-            # Check if we need to verify authentication status
-            if (self._last_auth_check is None or 
-                current_time - self._last_auth_check > self._auth_check_interval):
-                
-                await self._check_auth_status()
-                self._last_auth_check = current_time
-    
+        state = _AUTH_STATE
+
+        # Fast path: a fresh cached status means no lock and no await at all,
+        # so batched calls (e.g. N summaries under gather) pay one check each
+        if time.monotonic() < state.expires_at:
+            return
+
+        owner = False
+        async with state.lock:
+            if time.monotonic() < state.expires_at:
+                return
+
+            if state.inflight is None:
+                state.inflight = asyncio.get_running_loop().create_future()
+                owner = True
+            future = state.inflight
+
+        if not owner:
+            # Another adapter is already checking - wait for its result
+            await asyncio.shield(future)
+            return
+
+        try:
+            status = await self._check_auth_status()
+        except Exception as e:
+            async with state.lock:
+                state.inflight = None
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # consume so lone failures don't warn
+            raise
+
+        async with state.lock:
+            state.status = status
+            state.expires_at = time.monotonic() + self._auth_check_interval
+            state.inflight = None
+        if not future.done():
+            future.set_result(status)
+
     async def _check_auth_status(self) -> Dict[str, Any]:
         """Check current authentication status"""
+        state = _AUTH_STATE
         try:
             status = await _post("/iserver/auth/status")
-            self._session_status = status
-            
+
             if not status.get("authenticated", False):
                 logger.warning("Session not authenticated")
                 raise IBAPIError("Session not authenticated. Please log in through the IB Gateway.")
-            
-            # Start keep-alive if not already running
-            if self._keep_alive_task is None or self._keep_alive_task.done():
-                self._keep_alive_task = asyncio.create_task(self._keep_alive_loop())
-            
+
+            # Start the shared keep-alive loop if not already running
+            if state.keep_alive_task is None or state.keep_alive_task.done():
+                state.keep_alive_task = asyncio.create_task(self._keep_alive_loop())
+
             logger.debug(f"Auth status: {status}")
             return status
-            
+
         except IBAPIError as e:
             if e.status_code == 401:
                 # Try to reauthenticate
@@ -61,16 +108,40 @@ class SessionAdapter:
                 await self._reauthenticate()
                 return await self._check_auth_status()
             raise
-    
+
     async def _reauthenticate(self) -> None:
-        """Attempt to reauthenticate the session"""
+        """Attempt to reauthenticate the session (deduplicated across adapters)"""
+        state = _AUTH_STATE
+
+        owner = False
+        async with state.lock:
+            if state.reauth_inflight is None:
+                state.reauth_inflight = asyncio.get_running_loop().create_future()
+                owner = True
+            future = state.reauth_inflight
+
+        if not owner:
+            await asyncio.shield(future)
+            return
+
         try:
             result = await _post("/iserver/reauthenticate")
             logger.info(f"Reauthentication result: {result}")
         except Exception as e:
             logger.error(f"Reauthentication failed: {e}")
-            raise IBAPIError("Reauthentication failed. Manual login may be required.")
-    
+            error = IBAPIError("Reauthentication failed. Manual login may be required.")
+            async with state.lock:
+                state.reauth_inflight = None
+            if not future.done():
+                future.set_exception(error)
+                future.exception()
+            raise error
+
+        async with state.lock:
+            state.reauth_inflight = None
+        if not future.done():
+            future.set_result(result)
+
     async def _tickle(self) -> None:
         """Send keep-alive ping to maintain session"""
         try:
@@ -78,7 +149,7 @@ class SessionAdapter:
             logger.debug("Keep-alive tickle sent")
         except Exception as e:
             logger.warning(f"Keep-alive tickle failed: {e}")
-    
+
     async def _keep_alive_loop(self) -> None:
         """Background task to maintain session with periodic tickles"""
         while True:
@@ -91,31 +162,43 @@ class SessionAdapter:
             except Exception as e:
                 logger.error(f"Keep-alive loop error: {e}")
                 # Continue the loop despite errors
-    
+
     async def get_session_info(self) -> Dict[str, Any]:
         """Get current session information"""
         await self._ensure_live()
-        return self._session_status or {}
-    
+        return _AUTH_STATE.status or {}
+
     async def logout(self) -> None:
-        """Logout and cleanup session"""
-        if self._keep_alive_task and not self._keep_alive_task.done():
-            self._keep_alive_task.cancel()
+        """
+        Logout and cleanup session.
+        The session is process-wide, so only the first adapter to log out
+        stops the keep-alive loop and sends the logout request.
+        """
+        state = _AUTH_STATE
+
+        task, state.keep_alive_task = state.keep_alive_task, None
+        had_session = task is not None or state.status is not None
+        # Invalidate before the first await so concurrent logouts see the
+        # session as already torn down
+        state.invalidate()
+
+        if task and not task.done():
+            task.cancel()
             try:
-                await self._keep_alive_task
+                await task
             except asyncio.CancelledError:
                 pass
-        
-        try:
-            await _post("/logout")
-            logger.info("Session logged out")
-        except Exception as e:
-            logger.warning(f"Logout failed: {e}")
-        
-        self._session_status = None
-        self._last_auth_check = None
-    
-    def __del__(self):
-        """Cleanup when adapter is destroyed"""
-        if self._keep_alive_task and not self._keep_alive_task.done():
-            self._keep_alive_task.cancel() 
\ No newline at end of file
+
+        if had_session:
+            try:
+                await _post("/logout")
+                logger.info("Session logged out")
+            except Exception as e:
+                logger.warning(f"Logout failed: {e}")
+
+    async def __aenter__(self) -> "SessionAdapter":
+        await self._ensure_live()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.logout()
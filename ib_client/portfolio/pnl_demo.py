@@ -12,6 +12,11 @@ from typing import List, Dict, Any
 import json
 from decimal import Decimal
 
+try:
+    import orjson  # C-level JSON encoder; optional
+except ImportError:
+    orjson = None
+
 from .pnl import PnLAdapter, PnLRow, PnLByInstrument
 from .accounts import AccountsAdapter
 
@@ -19,21 +24,46 @@ from .accounts import AccountsAdapter
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _cents(value: Decimal) -> int:
+    """Round a Decimal amount to integer cents for cheap accumulation"""
+    return int(value.scaleb(2).to_integral_value())
+
+# Table layout built once at import; row loops bind .format directly
+_PNL_ROW_FMT = "{:<12} {:<10} {:<12} {:<15} {:<12} {:<12}".format
+_PNL_HDR = _PNL_ROW_FMT("Account ID", "Model", "Daily P&L", "Unrealized P&L", "Net Liq", "Market Value")
+_PNL_RULE = _PNL_ROW_FMT("-" * 12, "-" * 10, "-" * 12, "-" * 15, "-" * 12, "-" * 12)
+_POS_ROW_FMT = "{:<25} {:<12} {:<12} {:<12} {:<12} {:<12}".format
+_POS_HDR = _POS_ROW_FMT("Contract", "Position", "Daily P&L", "Unrealized", "Realized", "Value")
+_POS_RULE = _POS_ROW_FMT("-" * 25, "-" * 12, "-" * 12, "-" * 12, "-" * 12, "-" * 12)
+
 class PnLDemo:
     """Demo class to showcase P&L functionality"""
     
     def __init__(self):
         self.pnl_adapter = PnLAdapter()
         self.accounts_adapter = AccountsAdapter()
-    
+
+        # Cap concurrent gateway requests when fanning out over accounts
+        self._sem = asyncio.Semaphore(8)
+
+    async def _position_pnl(self, account_id: str) -> List[PnLByInstrument]:
+        """Position P&L fetch bounded by the demo-wide concurrency limit"""
+        async with self._sem:
+            return await self.pnl_adapter.get_pnl_by_position(account_id)
+
+    async def _pnl_summary(self, account_id: str) -> Dict[str, Any]:
+        """P&L summary fetch bounded by the demo-wide concurrency limit"""
+        async with self._sem:
+            return await self.pnl_adapter.get_account_pnl_summary(account_id)
+
+    # Bound once; the table loops call this six times per row
+    _fmt_currency = "${:,.2f}".format
+
     def format_currency(self, value: Decimal) -> str:
         """Format currency values for display"""
-        if value is None:
-            return "N/A"
-        try:
-            return f"${value:,.2f}"
-        except:
-            return str(value)
+        # Inputs are Optional[Decimal] model fields, which always format
+        # cleanly - no try/except needed per cell
+        return "N/A" if value is None else self._fmt_currency(value)
     
     def print_pnl_rows(self, pnl_rows: List[PnLRow], title: str):
         """Print P&L rows in a formatted table"""
@@ -45,14 +75,13 @@ class PnLDemo:
             print("No P&L data found.")
             return
         
-        # Print header
-        print(f"{'Account ID':<12} {'Model':<10} {'Daily P&L':<12} {'Unrealized P&L':<15} {'Net Liq':<12} {'Market Value':<12}")
-        print(f"{'-'*12} {'-'*10} {'-'*12} {'-'*15} {'-'*12} {'-'*12}")
-        
-        # Print P&L data
-        total_dpl = Decimal(0)
-        total_upl = Decimal(0)
-        
+        # Build the table as one list of rows and print it with a single
+        # write; totals accumulate as plain integer cents, which is far
+        # cheaper than a Decimal add per row
+        total_dpl_cents = 0
+        total_upl_cents = 0
+        lines = [_PNL_HDR, _PNL_RULE]
+
         for pnl in pnl_rows:
             account_id = pnl.acctId[:12] if pnl.acctId else "N/A"
             model = (pnl.model or "N/A")[:10]
@@ -60,17 +89,21 @@ class PnLDemo:
             upl = self.format_currency(pnl.upl)[:15]
             nl = self.format_currency(pnl.nl)[:12]
             mv = self.format_currency(pnl.mv)[:12]
-            
-            print(f"{account_id:<12} {model:<10} {dpl:<12} {upl:<15} {nl:<12} {mv:<12}")
-            
+
+            lines.append(_PNL_ROW_FMT(account_id, model, dpl, upl, nl, mv))
+
             # Add to totals
             if pnl.dpl:
-                total_dpl += pnl.dpl
+                total_dpl_cents += _cents(pnl.dpl)
             if pnl.upl:
-                total_upl += pnl.upl
-        
-        print(f"{'-'*12} {'-'*10} {'-'*12} {'-'*15} {'-'*12} {'-'*12}")
-        print(f"{'TOTALS':<12} {'':<10} {self.format_currency(total_dpl):<12} {self.format_currency(total_upl):<15}")
+                total_upl_cents += _cents(pnl.upl)
+
+        total_dpl = Decimal(total_dpl_cents).scaleb(-2)
+        total_upl = Decimal(total_upl_cents).scaleb(-2)
+        lines.append(_PNL_RULE)
+        lines.append(_PNL_ROW_FMT("TOTALS", "", self.format_currency(total_dpl),
+                                  self.format_currency(total_upl), "", ""))
+        print("\n".join(lines))
         
         print(f"\nTotal P&L entries: {len(pnl_rows)}")
     
@@ -84,15 +117,13 @@ class PnLDemo:
             print("No position P&L data found.")
             return
         
-        # Print header
-        print(f"{'Contract':<25} {'Position':<12} {'Daily P&L':<12} {'Unrealized':<12} {'Realized':<12} {'Value':<12}")
-        print(f"{'-'*25} {'-'*12} {'-'*12} {'-'*12} {'-'*12} {'-'*12}")
-        
-        # Print position data
-        total_daily = Decimal(0)
-        total_unrealized = Decimal(0)
-        total_realized = Decimal(0)
-        
+        # Build the table as one list of rows and print it with a single
+        # write; totals accumulate as integer cents (see print_pnl_rows)
+        total_daily_cents = 0
+        total_unrealized_cents = 0
+        total_realized_cents = 0
+        lines = [_POS_HDR, _POS_RULE]
+
         for pos in positions:
             contract = (pos.contractDesc or f"ConID:{pos.conid}")[:25]
             position = f"{pos.position:,.0f}" if pos.position else "0"
@@ -100,19 +131,25 @@ class PnLDemo:
             unrealized = self.format_currency(pos.unrealizedPnL)[:12]
             realized = self.format_currency(pos.realizedPnL)[:12]
             value = self.format_currency(pos.value)[:12]
-            
-            print(f"{contract:<25} {position:<12} {daily:<12} {unrealized:<12} {realized:<12} {value:<12}")
-            
+
+            lines.append(_POS_ROW_FMT(contract, position, daily, unrealized, realized, value))
+
             # Add to totals
             if pos.dailyPnL:
-                total_daily += pos.dailyPnL
+                total_daily_cents += _cents(pos.dailyPnL)
             if pos.unrealizedPnL:
-                total_unrealized += pos.unrealizedPnL
+                total_unrealized_cents += _cents(pos.unrealizedPnL)
             if pos.realizedPnL:
-                total_realized += pos.realizedPnL
-        
-        print(f"{'-'*25} {'-'*12} {'-'*12} {'-'*12} {'-'*12} {'-'*12}")
-        print(f"{'TOTALS':<25} {'':<12} {self.format_currency(total_daily):<12} {self.format_currency(total_unrealized):<12} {self.format_currency(total_realized):<12}")
+                total_realized_cents += _cents(pos.realizedPnL)
+
+        total_daily = Decimal(total_daily_cents).scaleb(-2)
+        total_unrealized = Decimal(total_unrealized_cents).scaleb(-2)
+        total_realized = Decimal(total_realized_cents).scaleb(-2)
+        lines.append(_POS_RULE)
+        lines.append(_POS_ROW_FMT("TOTALS", "", self.format_currency(total_daily),
+                                  self.format_currency(total_unrealized),
+                                  self.format_currency(total_realized), ""))
+        print("\n".join(lines))
         
         print(f"\nTotal positions: {len(positions)}")
     
@@ -128,7 +165,11 @@ class PnLDemo:
         
         # Pretty print the summary as JSON
         try:
-            print(json.dumps(summary, indent=2, default=str))
+            if orjson is not None:
+                print(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                   default=str).decode())
+            else:
+                print(json.dumps(summary, indent=2, default=str))
         except Exception as e:
             print(f"Error formatting summary: {e}")
             print(f"Raw summary: {summary}")
@@ -153,39 +194,38 @@ class PnLDemo:
             logger.error(f"Partitioned P&L error: {e}")
             return []
     
-    async def demo_position_pnl_for_accounts(self):
+    async def demo_position_pnl_for_accounts(self, accounts=None):
         """Demo: Get P&L by position for all accounts"""
         print("\n🎯 Getting P&L by Position for All Accounts...")
-        
+
         try:
-            # First get available accounts
-            accounts = await self.accounts_adapter.get_accounts()
-            
+            # Use the caller's account list when given (run_all_demos fetches
+            # it once for every demo step)
+            if accounts is None:
+                accounts = await self.accounts_adapter.get_accounts()
+
             if not accounts:
                 print("⚠️  No accounts available for position P&L retrieval")
                 return
             
             all_positions = []
-            
-            for account in accounts:
-                try:
-                    print(f"\n🔍 Getting position P&L for account: {account.id}")
-                    positions = await self.pnl_adapter.get_pnl_by_position(account.id)
-                    
-                    if positions:
-                        self.print_position_pnl(positions, f"📈 POSITION P&L - {account.id}")
-                        all_positions.extend(positions)
-                    else:
-                        print(f"⚠️  No positions found for account {account.id}")
-                    
-                    # Brief pause between requests
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"❌ Error getting position P&L for account {account.id}: {e}")
-                    logger.error(f"Position P&L error for {account.id}: {e}")
-                    continue
-            
+
+            # Fetch every account concurrently, then print in account order
+            results = await asyncio.gather(
+                *(self._position_pnl(account.id) for account in accounts),
+                return_exceptions=True
+            )
+            for account, positions in zip(accounts, results):
+                print(f"\n🔍 Getting position P&L for account: {account.id}")
+                if isinstance(positions, Exception):
+                    print(f"❌ Error getting position P&L for account {account.id}: {positions}")
+                    logger.error(f"Position P&L error for {account.id}: {positions}")
+                elif positions:
+                    self.print_position_pnl(positions, f"📈 POSITION P&L - {account.id}")
+                    all_positions.extend(positions)
+                else:
+                    print(f"⚠️  No positions found for account {account.id}")
+
             return all_positions
             
         except Exception as e:
@@ -193,32 +233,32 @@ class PnLDemo:
             logger.error(f"Position P&L error: {e}")
             return []
     
-    async def demo_account_pnl_summaries(self):
+    async def demo_account_pnl_summaries(self, accounts=None):
         """Demo: Get P&L summaries for all accounts"""
         print("\n📋 Getting P&L Summaries for All Accounts...")
-        
+
         try:
-            # First get available accounts
-            accounts = await self.accounts_adapter.get_accounts()
-            
+            # See demo_position_pnl_for_accounts for the shared-list contract
+            if accounts is None:
+                accounts = await self.accounts_adapter.get_accounts()
+
             if not accounts:
                 print("⚠️  No accounts available for P&L summary retrieval")
                 return
             
-            for account in accounts:
-                try:
-                    print(f"\n🔍 Getting P&L summary for account: {account.id}")
-                    summary = await self.pnl_adapter.get_account_pnl_summary(account.id)
+            # Fetch every summary concurrently, then print in account order
+            results = await asyncio.gather(
+                *(self._pnl_summary(account.id) for account in accounts),
+                return_exceptions=True
+            )
+            for account, summary in zip(accounts, results):
+                print(f"\n🔍 Getting P&L summary for account: {account.id}")
+                if isinstance(summary, Exception):
+                    print(f"❌ Error getting P&L summary for account {account.id}: {summary}")
+                    logger.error(f"P&L summary error for {account.id}: {summary}")
+                else:
                     self.print_pnl_summary(summary, account.id)
-                    
-                    # Brief pause between requests
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"❌ Error getting P&L summary for account {account.id}: {e}")
-                    logger.error(f"P&L summary error for {account.id}: {e}")
-                    continue
-            
+
         except Exception as e:
             print(f"❌ Error getting P&L summaries: {e}")
             logger.error(f"P&L summaries error: {e}")
@@ -234,12 +274,17 @@ class PnLDemo:
         print(f"\n📊 P&L Analysis Summary:")
         print(f"{'='*50}")
         
-        # Analyze partitioned P&L
+        # Analyze partitioned P&L - one traversal for all three totals
         if pnl_rows:
-            total_daily = sum(pnl.dpl for pnl in pnl_rows if pnl.dpl)
-            total_unrealized = sum(pnl.upl for pnl in pnl_rows if pnl.upl)
-            total_net_liq = sum(pnl.nl for pnl in pnl_rows if pnl.nl)
-            
+            total_daily = total_unrealized = total_net_liq = Decimal(0)
+            for pnl in pnl_rows:
+                if pnl.dpl:
+                    total_daily += pnl.dpl
+                if pnl.upl:
+                    total_unrealized += pnl.upl
+                if pnl.nl:
+                    total_net_liq += pnl.nl
+
             print(f"💼 Portfolio Overview:")
             print(f"  Total Daily P&L: {self.format_currency(total_daily)}")
             print(f"  Total Unrealized P&L: {self.format_currency(total_unrealized)}")
@@ -252,37 +297,47 @@ class PnLDemo:
                 print(f"  Daily Return: {daily_return_pct:.2f}%")
                 print(f"  Unrealized Return: {unrealized_return_pct:.2f}%")
         
-        # Analyze position P&L
+        # Analyze position P&L - counts, winner and loser in a single pass
         if positions:
-            profitable_positions = [pos for pos in positions if pos.unrealizedPnL and pos.unrealizedPnL > 0]
-            losing_positions = [pos for pos in positions if pos.unrealizedPnL and pos.unrealizedPnL < 0]
-            
+            profitable_count = losing_count = 0
+            top_winner = top_loser = None
+
+            for pos in positions:
+                upl = pos.unrealizedPnL
+                if not upl:
+                    continue
+                if upl > 0:
+                    profitable_count += 1
+                    if top_winner is None or upl > top_winner.unrealizedPnL:
+                        top_winner = pos
+                else:
+                    losing_count += 1
+                    if top_loser is None or upl < top_loser.unrealizedPnL:
+                        top_loser = pos
+
             print(f"\n🎯 Position Analysis:")
             print(f"  Total Positions: {len(positions)}")
-            print(f"  Profitable Positions: {len(profitable_positions)}")
-            print(f"  Losing Positions: {len(losing_positions)}")
-            
-            if positions:
-                win_rate = (len(profitable_positions) / len(positions)) * 100
-                print(f"  Win Rate: {win_rate:.1f}%")
-            
-            # Top winners and losers
-            if profitable_positions:
-                top_winner = max(profitable_positions, key=lambda x: x.unrealizedPnL or Decimal(0))
+            print(f"  Profitable Positions: {profitable_count}")
+            print(f"  Losing Positions: {losing_count}")
+
+            win_rate = (profitable_count / len(positions)) * 100
+            print(f"  Win Rate: {win_rate:.1f}%")
+
+            if top_winner is not None:
                 print(f"  Top Winner: {top_winner.contractDesc} ({self.format_currency(top_winner.unrealizedPnL)})")
-            
-            if losing_positions:
-                top_loser = min(losing_positions, key=lambda x: x.unrealizedPnL or Decimal(0))
+
+            if top_loser is not None:
                 print(f"  Top Loser: {top_loser.contractDesc} ({self.format_currency(top_loser.unrealizedPnL)})")
     
-    async def demo_single_account_deep_dive(self):
+    async def demo_single_account_deep_dive(self, accounts=None):
         """Demo: Deep dive into P&L for a single account"""
         print("\n🔬 Single Account P&L Deep Dive...")
-        
+
         try:
-            # Get the first available account
-            accounts = await self.accounts_adapter.get_accounts()
-            
+            # Only the first account is needed; reuse the shared list
+            if accounts is None:
+                accounts = await self.accounts_adapter.get_accounts()
+
             if not accounts:
                 print("⚠️  No accounts available for deep dive")
                 return
@@ -290,9 +345,13 @@ class PnLDemo:
             account = accounts[0]
             print(f"\n🎯 Deep dive for account: {account.id}")
             
-            # Get all P&L data for this account
-            summary = await self.pnl_adapter.get_account_pnl_summary(account.id)
-            positions = await self.pnl_adapter.get_pnl_by_position(account.id)
+            # Get all P&L data for this account; the two calls are
+            # independent, so overlap them instead of awaiting serially
+            async with asyncio.TaskGroup() as tg:
+                t_summary = tg.create_task(self.pnl_adapter.get_account_pnl_summary(account.id))
+                t_positions = tg.create_task(self.pnl_adapter.get_pnl_by_position(account.id))
+            summary = t_summary.result()
+            positions = t_positions.result()
             
             print(f"\n📊 Complete P&L Picture for {account.id}:")
             
@@ -302,10 +361,14 @@ class PnLDemo:
             if positions:
                 self.print_position_pnl(positions, f"📈 ALL POSITIONS - {account.id}")
                 
-                # Additional analysis for this account
-                total_value = sum(pos.value for pos in positions if pos.value)
-                total_unrealized = sum(pos.unrealizedPnL for pos in positions if pos.unrealizedPnL)
-                
+                # Additional analysis for this account, in one traversal
+                total_value = total_unrealized = Decimal(0)
+                for pos in positions:
+                    if pos.value:
+                        total_value += pos.value
+                    if pos.unrealizedPnL:
+                        total_unrealized += pos.unrealizedPnL
+
                 print(f"\n💡 Account Insights:")
                 print(f"  Portfolio Value: {self.format_currency(total_value)}")
                 print(f"  Total Unrealized P&L: {self.format_currency(total_unrealized)}")
@@ -325,19 +388,28 @@ class PnLDemo:
         
         # First get partitioned P&L
         pnl_rows = await self.demo_partitioned_pnl()
-        
+
+        # Fetch the account list once and hand it to every demo step instead
+        # of each step issuing the same round trip
+        try:
+            accounts = await self.accounts_adapter.get_accounts()
+        except Exception as e:
+            print(f"❌ Failed to get accounts: {e}")
+            logger.error(f"Failed to get accounts: {e}")
+            accounts = []
+
         demos = [
             ("Position P&L for All Accounts", self.demo_position_pnl_for_accounts),
             ("Account P&L Summaries", self.demo_account_pnl_summaries),
             ("Single Account Deep Dive", self.demo_single_account_deep_dive)
         ]
-        
+
         positions = []
-        
+
         for demo_name, demo_func in demos:
             try:
                 print(f"\n🚀 Running {demo_name}...")
-                result = await demo_func()
+                result = await demo_func(accounts)
                 if demo_name == "Position P&L for All Accounts" and result:
                     positions = result
                 await asyncio.sleep(1)  # Brief pause between demos
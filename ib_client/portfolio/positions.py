@@ -1,5 +1,6 @@
-from typing import List, Optional, Any, Dict
-from pydantic import BaseModel, field_validator
+import asyncio
+from typing import AsyncIterator, List, Optional, Any, Dict
+from pydantic import BaseModel, ConfigDict, model_validator
 from decimal import Decimal
 import logging
 
@@ -9,6 +10,10 @@ from ..core.http import _get
 logger = logging.getLogger(__name__)
 
 class Position(BaseModel):
+    # Rows are read-only once parsed; freezing skips the mutability
+    # machinery and makes instances hashable for downstream sets/dicts
+    model_config = ConfigDict(frozen=True)
+
     acctId: str
     conid: int
     contractDesc: str
@@ -30,6 +35,41 @@ class Position(BaseModel):
     assetClass: Optional[str] = None
     undConid: Optional[int] = None
 
+# Field-name sets resolved once at import for the fast construct path
+_POSITION_FIELDS = frozenset(Position.model_fields)
+_POSITION_DECIMAL_FIELDS = frozenset((
+    "position", "mktPrice", "mktValue", "avgCost", "avgPrice",
+    "realizedPnl", "unrealizedPnl", "multiplier", "strike",
+))
+
+def _fast_position(pos_data: Dict[str, Any]) -> Position:
+    """Build a Position from trusted gateway JSON without full validation.
+
+    Position has no custom validators, so the schema walk Pydantic does
+    per row buys nothing on this hot path; one pass coerces the Decimal
+    fields and drops unknown keys, then model_construct assigns directly.
+    Malformed rows fall back to the validating constructor at the call
+    site.
+    """
+    values = {}
+    for key, value in pos_data.items():
+        if key not in _POSITION_FIELDS:
+            continue
+        if key in _POSITION_DECIMAL_FIELDS and value is not None and type(value) is not Decimal:
+            value = Decimal(str(value))
+        values[key] = value
+    return Position.model_construct(**values)
+
+# Decimal-typed Summary fields coerced tolerantly (junk values become None)
+_SUMMARY_DECIMAL_FIELDS = frozenset((
+    'accruedcash', 'availablefunds', 'buyingpower', 'cushion',
+    'equitywithloanvalue', 'excessliquidity', 'fullavailablefunds',
+    'fullexcessliquidity', 'fullinitmarginreq', 'fullmaintmarginreq',
+    'grosspositionvalue', 'initmarginreq', 'lookaheadavailablefunds',
+    'lookaheadexcessliquidity', 'lookaheadinitmarginreq', 'lookaheadmaintmarginreq',
+    'maintmarginreq', 'netliquidation', 'totalcashvalue',
+))
+
 class Summary(BaseModel):
     accountcode: str
     accountready: str
@@ -94,48 +134,40 @@ class Summary(BaseModel):
     totalcashvalue_s: Optional[str] = None
     tradingtype_s: Optional[str] = None
 
-    @field_validator('accountcode', 'accountready', 'accounttype', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def extract_string_value(cls, v):
-        """Extract string value from IB API response format"""
-        if isinstance(v, dict) and 'value' in v:
-            return v['value']
-        return v
+    def extract_values(cls, data):
+        """Unwrap the IB API response format in a single pass.
 
-    @field_validator(
-        'accruedcash', 'availablefunds', 'buyingpower', 'cushion', 
-        'equitywithloanvalue', 'excessliquidity', 'fullavailablefunds',
-        'fullexcessliquidity', 'fullinitmarginreq', 'fullmaintmarginreq',
-        'grosspositionvalue', 'initmarginreq', 'lookaheadavailablefunds',
-        'lookaheadexcessliquidity', 'lookaheadinitmarginreq', 'lookaheadmaintmarginreq',
-        'maintmarginreq', 'netliquidation', 'totalcashvalue', mode='before'
-    )
-    @classmethod
-    def extract_decimal_value(cls, v):
-        """Extract decimal value from IB API response format"""
-        if isinstance(v, dict) and 'amount' in v:
-            return Decimal(str(v['amount']))
-        elif isinstance(v, dict) and 'value' in v:
-            try:
-                return Decimal(str(v['value']))
-            except:
-                return None
-        elif v is not None:
-            try:
-                return Decimal(str(v))
-            except:
-                return None
-        return v
+        The gateway wraps summary values as {'amount': x} or {'value': x};
+        this used to run as 23 per-field validators, each re-testing the
+        same dict shapes. One walk over the payload now unwraps every
+        field, coerces the Decimal-typed ones (junk becomes None, as
+        before), and normalizes the boolean flag.
+        """
+        if not isinstance(data, dict):
+            return data
 
-    @field_validator('nlvandmargininreview', mode='before')
-    @classmethod
-    def extract_bool_value(cls, v):
-        """Extract boolean value from IB API response format"""
-        if isinstance(v, dict) and 'value' in v:
-            return v['value'].lower() == 'true' if isinstance(v['value'], str) else v['value']
-        elif isinstance(v, str):
-            return v.lower() == 'true'
-        return v
+        decimal_fields = _SUMMARY_DECIMAL_FIELDS
+        for key, v in data.items():
+            if isinstance(v, dict):
+                if 'amount' in v:
+                    v = v['amount']
+                elif 'value' in v:
+                    v = v['value']
+
+            if key in decimal_fields:
+                if v is not None and type(v) is not Decimal:
+                    try:
+                        v = Decimal(str(v))
+                    except (ValueError, TypeError, ArithmeticError):
+                        v = None
+            elif key == 'nlvandmargininreview' and isinstance(v, str):
+                v = v.lower() == 'true'
+
+            data[key] = v
+
+        return data
 
 class LedgerLine(BaseModel):
     commoditymarketvalue: Optional[Decimal] = None
@@ -166,6 +198,34 @@ class LedgerLine(BaseModel):
     tbillsmarketvalue: Optional[Decimal] = None
     dividends: Optional[Decimal] = None
 
+# Field-name sets for the fast ledger construct path, derived from the
+# model so they track the declaration
+_LEDGER_FIELDS = frozenset(LedgerLine.model_fields)
+_LEDGER_DECIMAL_FIELDS = frozenset(
+    name for name, field in LedgerLine.model_fields.items()
+    if field.annotation == Optional[Decimal]
+)
+
+def _fast_ledger_line(ledger_data: Dict[str, Any], currency: Optional[str] = None) -> LedgerLine:
+    """Build a LedgerLine from one raw per-currency ledger entry.
+
+    LedgerLine has no custom validators, so one coercion pass plus
+    model_construct replaces the full validation walk (see
+    _fast_position). When the entry comes from a {"USD": {...}} shaped
+    response, the outer key supplies the currency unless the entry
+    already carries one.
+    """
+    values = {}
+    for key, value in ledger_data.items():
+        if key not in _LEDGER_FIELDS:
+            continue
+        if key in _LEDGER_DECIMAL_FIELDS and value is not None and type(value) is not Decimal:
+            value = Decimal(str(value))
+        values[key] = value
+    if currency is not None and "currency" not in values:
+        values["currency"] = currency
+    return LedgerLine.model_construct(**values)
+
 class PortfolioAdapter(SessionAdapter):
     """Adapter for portfolio positions, summary, and ledger data"""
     
@@ -183,11 +243,15 @@ class PortfolioAdapter(SessionAdapter):
             positions = []
             for pos_data in data:
                 try:
-                    position = Position(**pos_data)
-                    positions.append(position)
-                except Exception as e:
-                    logger.warning(f"Failed to parse position data: {pos_data}, error: {e}")
-                    # Continue with other positions
+                    positions.append(_fast_position(pos_data))
+                except Exception:
+                    # Malformed row - retry through full validation so the
+                    # warning carries pydantic's diagnosis
+                    try:
+                        positions.append(Position(**pos_data))
+                    except Exception as e:
+                        logger.warning(f"Failed to parse position data: {pos_data}, error: {e}")
+                        # Continue with other positions
             
             logger.info(f"Found {len(positions)} positions for account {account}")
             return positions
@@ -221,8 +285,18 @@ class PortfolioAdapter(SessionAdapter):
             ledger_lines = []
             # The API may return different structures
             if isinstance(data, dict):
-                # Handle single currency case
-                ledger_lines.append(LedgerLine(**data))
+                if data and all(isinstance(v, dict) for v in data.values()):
+                    # Per-currency map: {"USD": {...}, "EUR": {...}}. The old
+                    # code wrapped the outer dict as one LedgerLine, losing
+                    # every currency's lines
+                    for currency_key, ledger_data in data.items():
+                        try:
+                            ledger_lines.append(_fast_ledger_line(ledger_data, currency_key))
+                        except Exception as e:
+                            logger.warning(f"Failed to parse ledger data: {ledger_data}, error: {e}")
+                else:
+                    # Handle single currency case
+                    ledger_lines.append(LedgerLine(**data))
             elif isinstance(data, list):
                 # Handle multiple currencies
                 for ledger_data in data:
@@ -239,27 +313,68 @@ class PortfolioAdapter(SessionAdapter):
             logger.error(f"Failed to get ledger for {account}: {e}")
             raise
     
+    # Pages fetched speculatively per batch in all_positions
+    _PAGE_WINDOW = 8
+
+    # Rows per page served by the IBKR positions endpoint; a shorter page
+    # is the last real one
+    _PAGE_SIZE = 30
+
+    # Safety cap to avoid runaway pagination
+    _MAX_PAGES = 100
+
     async def all_positions(self, account: str) -> List[Position]:
-        """Get all positions for an account by fetching all pages"""
+        """Get all positions for an account by fetching all pages.
+
+        Pages are idempotent GETs, so they are fetched speculatively in
+        windows of _PAGE_WINDOW instead of one round trip at a time;
+        results are appended in page order and fetching stops at the
+        first empty or failed page, matching the old sequential
+        semantics.
+        """
         all_positions = []
-        page = 0
-        
-        while True:
-            try:
-                positions = await self.positions(account, page)
-                if not positions:
-                    break
-                
-                all_positions.extend(positions)
-                page += 1
-                
-                # Safety check to avoid infinite loops
-                if page > 100:
-                    logger.warning(f"Stopped fetching positions after 100 pages for account {account}")
-                    break
-                    
-            except Exception as e:
-                logger.error(f"Error fetching page {page} for account {account}: {e}")
-                break
-        
-        return all_positions 
\ No newline at end of file
+        base = 0
+
+        while base < self._MAX_PAGES:
+            window = range(base, min(base + self._PAGE_WINDOW, self._MAX_PAGES))
+            results = await asyncio.gather(
+                *(self.positions(account, page) for page in window),
+                return_exceptions=True
+            )
+
+            for page, result in zip(window, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error fetching page {page} for account {account}: {result}")
+                    return all_positions
+                if not result:
+                    return all_positions
+                all_positions.extend(result)
+                # A short page is the last real one - stop without probing
+                # for an empty page (the check above stays as a fallback)
+                if len(result) < self._PAGE_SIZE:
+                    return all_positions
+
+            base += self._PAGE_WINDOW
+
+        logger.warning(f"Stopped fetching positions after {self._MAX_PAGES} pages for account {account}")
+        return all_positions
+
+    async def iter_positions(self, account: str) -> AsyncIterator[Position]:
+        """Yield positions for an account, fetching pages lazily.
+
+        Pages are pulled one at a time and only while the caller keeps
+        iterating, so breaking out early (e.g. a tool that wants the
+        first N positions) skips both the remaining round trips and the
+        fully materialized list. Callers that want everything should use
+        all_positions, which fetches pages in parallel windows instead.
+        """
+        for page in range(self._MAX_PAGES):
+            result = await self.positions(account, page)
+            if not result:
+                return
+            for position in result:
+                yield position
+            # A short page is the last real one
+            if len(result) < self._PAGE_SIZE:
+                return
+        logger.warning(f"Stopped iterating positions after {self._MAX_PAGES} pages for account {account}") 
\ No newline at end of file
@@ -1,5 +1,8 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+import asyncio
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
 from decimal import Decimal
 import logging
 
@@ -17,6 +20,9 @@ class ScannerParam(BaseModel):
 
 class ScanResult(BaseModel):
     """Individual scan result item"""
+    # Results are read-only once parsed (see Position)
+    model_config = ConfigDict(frozen=True)
+
     conid: int
     symbol: str
     contractDesc: str
@@ -39,28 +45,179 @@ class ScanRequest(BaseModel):
     filter: List[Dict[str, Any]] = []
     size: int = 50
 
+def _scan_request(scan_type: str, location: str, size: int,
+                  filters: Optional[List[Dict[str, Any]]] = None) -> ScanRequest:
+    """Build a ScanRequest for the convenience wrappers.
+
+    The values are library-controlled (scan type literals plus caller
+    size/location), so construction skips Pydantic validation.
+    """
+    return ScanRequest.model_construct(
+        instrument="STK",
+        location=location,
+        type=scan_type,
+        filter=filters if filters is not None else [],
+        size=size
+    )
+
+def _freeze_filters(filters: List[Dict[str, Any]]) -> Optional[Tuple]:
+    """Turn a filter list into a hashable cache key, or None if it contains
+    unhashable values"""
+    try:
+        key = tuple(tuple(sorted(f.items())) for f in filters)
+        hash(key)  # filter values may themselves be unhashable
+        return key
+    except TypeError:
+        return None
+
+@lru_cache(maxsize=128)
+def _build_scan_payload(instrument: str, location: str, scan_type: str, size: int,
+                        filter_key: Tuple) -> Dict[str, Any]:
+    """Build (and cache) the scanner request payload.
+
+    Pollers re-run the same scans at fixed parameters; the payload dict is
+    identical every time, so it is memoized on the frozen parameters. The
+    returned dict is shared between calls and must not be mutated.
+    """
+    return {
+        "instrument": instrument,
+        "location": location,
+        "type": scan_type,
+        "size": size,
+        "filter": [dict(items) for items in filter_key],
+    }
+
+@lru_cache(maxsize=4096)
+def _decimal_from_token(token: str) -> Optional[Decimal]:
+    """Memoized string -> Decimal; scan responses repeat tokens like '0.00'"""
+    try:
+        return Decimal(token)
+    except (ValueError, TypeError, ArithmeticError):
+        return None
+
+# Maps every known gateway key (snake_case and camelCase variants) to the
+# ScanResult attribute it feeds; one pass over a row replaces the paired
+# nested .get probes per field
+_SCAN_FIELD_ALIASES = {
+    "con_id": "conid", "conid": "conid",
+    "symbol": "symbol",
+    "contract_description_1": "contractDesc", "contractDesc": "contractDesc",
+    "sec_type": "secType", "secType": "secType",
+    "listing_exchange": "exchange", "exchange": "exchange",
+    "currency": "currency",
+    "price": "price",
+    "change": "change",
+    "changePercent": "changePercent",
+    "volume": "volume",
+    "marketCap": "marketCap",
+    "pe": "pe",
+    "dividend": "dividend",
+}
+
+# Snake-case variants win when a row carries both spellings, matching the
+# old nested-get precedence
+_SCAN_PRIMARY_KEYS = frozenset(("con_id", "contract_description_1", "sec_type", "listing_exchange"))
+
+def _parse_decimal(value: Any) -> Optional[Decimal]:
+    """Parse decimal value safely.
+
+    Branches are ordered by how often each input type shows up in scan
+    responses; ints and floats convert without an exception frame, and
+    floats skip the memo cache since their tokens rarely repeat. The
+    float path keeps the str() round trip (shortest repr) rather than
+    Decimal.from_float, which would drag the full binary expansion into
+    every displayed price.
+    """
+    if value is None:
+        return None
+    kind = type(value)
+    if kind is int:
+        return Decimal(value)
+    if kind is float:
+        return Decimal(str(value))
+    if kind is Decimal:
+        return value
+    return _decimal_from_token(str(value))
+
+def _parse_int(value: Any) -> Optional[int]:
+    """Parse integer value safely"""
+    if value is None:
+        return None
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
 class ScannerAdapter(SessionAdapter):
     """Adapter for market screening and scanning functionality"""
-    
+
+    # How long cached scanner params stay valid
+    _PARAMS_TTL = 3600.0
+
     def __init__(self):
         super().__init__()
         self._cached_params: Optional[Dict] = None
-    
+        self._params_expires_at = 0.0
+        self._params_future: Optional[asyncio.Future] = None
+        self._scan_codes: Tuple[str, ...] = ()
+        self._locations: Tuple[str, ...] = ()
+
     async def get_scanner_params(self) -> Dict[str, Any]:
         """Get available scanner parameters and filters"""
         await self._ensure_live()
-        
+
         try:
-            if self._cached_params is None:
-                data = await _get("/iserver/scanner/params")
-                self._cached_params = data
-                logger.debug(f"Scanner params: {data}")
-            
+            if self._cached_params is not None and time.monotonic() < self._params_expires_at:
+                return self._cached_params
+
+            # Single-flight: concurrent cold-cache callers share one fetch
+            # instead of each issuing their own; failed fetches are not
+            # reused because a done-with-exception future is replaced
+            future = self._params_future
+            if future is None or future.done():
+                future = asyncio.ensure_future(_get("/iserver/scanner/params"))
+                self._params_future = future
+            data = await asyncio.shield(future)
+
+            self._cached_params = data
+            self._params_expires_at = time.monotonic() + self._PARAMS_TTL
+            # Precompute the derived lookups once per cache fill so the
+            # accessors below return without re-walking the tree
+            self._scan_codes = self._extract_scan_codes(data)
+            self._locations = self._extract_locations(data)
+            logger.debug(f"Scanner params: {data}")
+
             return self._cached_params
-            
+
         except Exception as e:
             logger.error(f"Failed to get scanner params: {e}")
             raise
+
+    @staticmethod
+    def _extract_scan_codes(params: Any) -> Tuple[str, ...]:
+        """Pull the scan codes out of a raw params payload"""
+        if not isinstance(params, dict):
+            return ()
+        return tuple(
+            scan_type["code"]
+            for scan_type in params.get("scan_type_list", ())
+            if isinstance(scan_type, dict) and "code" in scan_type
+        )
+
+    @staticmethod
+    def _extract_locations(params: Any) -> Tuple[str, ...]:
+        """Pull the location types out of a raw params payload"""
+        if not isinstance(params, dict):
+            return ()
+        locations = []
+        for location_group in params.get("location_tree", ()):
+            if isinstance(location_group, dict):
+                for location in location_group.get("locations", ()):
+                    if isinstance(location, dict) and "type" in location:
+                        locations.append(location["type"])
+        return tuple(locations)
     
     async def run_scan(self, scan_request: ScanRequest) -> List[ScanResult]:
         """Run a market scan with specified parameters"""
@@ -68,14 +225,22 @@ class ScannerAdapter(SessionAdapter):
         
         try:
             # Build scan request payload according to IBKR Web API format
-            # The filter field is REQUIRED and must be an array
-            scan_data = {
-                "instrument": scan_request.instrument,
-                "location": scan_request.location,
-                "type": scan_request.type,
-                "size": scan_request.size,
-                "filter": scan_request.filter
-            }
+            # The filter field is REQUIRED and must be an array. Payloads
+            # for hashable parameters come from the memoized builder
+            filter_key = _freeze_filters(scan_request.filter)
+            if filter_key is not None:
+                scan_data = _build_scan_payload(
+                    scan_request.instrument, scan_request.location,
+                    scan_request.type, scan_request.size, filter_key
+                )
+            else:
+                scan_data = {
+                    "instrument": scan_request.instrument,
+                    "location": scan_request.location,
+                    "type": scan_request.type,
+                    "size": scan_request.size,
+                    "filter": scan_request.filter
+                }
             
             logger.debug(f"Scanner request payload: {scan_data}")
             data = await _post("/iserver/scanner/run", json_data=scan_data)
@@ -93,24 +258,32 @@ class ScannerAdapter(SessionAdapter):
             
             for contract_data in contracts:
                 try:
-                    # Map IBKR response fields to our model
-                    scan_result = ScanResult(
-                        conid=contract_data.get("con_id", contract_data.get("conid", 0)),
-                        symbol=contract_data.get("symbol", ""),
-                        contractDesc=contract_data.get("contract_description_1", 
-                                                     contract_data.get("contractDesc", "")),
-                        secType=contract_data.get("sec_type", 
-                                                contract_data.get("secType", "")),
-                        exchange=contract_data.get("listing_exchange", 
-                                                 contract_data.get("exchange")),
-                        currency=contract_data.get("currency"),
-                        price=self._parse_decimal(contract_data.get("price")),
-                        change=self._parse_decimal(contract_data.get("change")),
-                        changePercent=self._parse_decimal(contract_data.get("changePercent")),
-                        volume=self._parse_int(contract_data.get("volume")),
-                        marketCap=self._parse_decimal(contract_data.get("marketCap")),
-                        pe=self._parse_decimal(contract_data.get("pe")),
-                        dividend=self._parse_decimal(contract_data.get("dividend"))
+                    # Map IBKR response fields to our model in a single pass
+                    # over the row against the precompiled alias map; numeric
+                    # fields are coerced by the parse helpers, so
+                    # construction can skip Pydantic validation
+                    row = {}
+                    for key, value in contract_data.items():
+                        target = _SCAN_FIELD_ALIASES.get(key)
+                        if target is None:
+                            continue
+                        if key in _SCAN_PRIMARY_KEYS or target not in row:
+                            row[target] = value
+
+                    scan_result = ScanResult.model_construct(
+                        conid=row.get("conid", 0),
+                        symbol=row.get("symbol", ""),
+                        contractDesc=row.get("contractDesc", ""),
+                        secType=row.get("secType", ""),
+                        exchange=row.get("exchange"),
+                        currency=row.get("currency"),
+                        price=_parse_decimal(row.get("price")),
+                        change=_parse_decimal(row.get("change")),
+                        changePercent=_parse_decimal(row.get("changePercent")),
+                        volume=_parse_int(row.get("volume")),
+                        marketCap=_parse_decimal(row.get("marketCap")),
+                        pe=_parse_decimal(row.get("pe")),
+                        dividend=_parse_decimal(row.get("dividend"))
                     )
                     scan_results.append(scan_result)
                 except Exception as e:
@@ -125,118 +298,48 @@ class ScannerAdapter(SessionAdapter):
     
     async def top_gainers(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get top percentage gainers"""
-        scan_request = ScanRequest(
-            type="TOP_PERC_GAIN",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("TOP_PERC_GAIN", location, max_results))
     
     async def top_losers(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get top percentage losers"""
-        scan_request = ScanRequest(
-            type="TOP_PERC_LOSE",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("TOP_PERC_LOSE", location, max_results))
     
     async def most_active(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get most active stocks by volume"""
-        scan_request = ScanRequest(
-            type="MOST_ACTIVE",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("MOST_ACTIVE", location, max_results))
     
     async def most_active_usd(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get most active stocks by USD volume"""
-        scan_request = ScanRequest(
-            type="MOST_ACTIVE_USD",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("MOST_ACTIVE_USD", location, max_results))
     
     async def hot_by_volume(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get stocks hot by volume"""
-        scan_request = ScanRequest(
-            type="HOT_BY_VOLUME",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("HOT_BY_VOLUME", location, max_results))
     
     async def top_trade_count(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get stocks with highest trade count"""
-        scan_request = ScanRequest(
-            type="TOP_TRADE_COUNT",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("TOP_TRADE_COUNT", location, max_results))
     
     async def high_opt_volume_put_call_ratio(self, max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Get stocks with high options volume put/call ratio"""
-        scan_request = ScanRequest(
-            type="HIGH_OPT_VOLUME_PUT_CALL_RATIO",
-            location=location,
-            size=max_results
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request("HIGH_OPT_VOLUME_PUT_CALL_RATIO", location, max_results))
     
     async def custom_scan(self, scan_type: str, filters: List[Dict[str, Any]] = None,
                          max_results: int = 50, location: str = "STK.US.MAJOR") -> List[ScanResult]:
         """Run a custom scan with specified scan type and filters"""
-        scan_request = ScanRequest(
-            type=scan_type,
-            location=location,
-            size=max_results,
-            filter=filters if filters is not None else []
-        )
-        return await self.run_scan(scan_request)
+        return await self.run_scan(_scan_request(scan_type, location, max_results, filters))
     
     async def get_available_scan_codes(self) -> List[str]:
         """Get list of available scan codes"""
-        params = await self.get_scanner_params()
-        
-        scan_codes = []
-        if isinstance(params, dict) and "scan_type_list" in params:
-            for scan_type in params["scan_type_list"]:
-                if isinstance(scan_type, dict) and "code" in scan_type:
-                    scan_codes.append(scan_type["code"])
-        
-        return scan_codes
-    
+        await self.get_scanner_params()
+        return list(self._scan_codes)
+
     async def get_available_locations(self) -> List[str]:
         """Get list of available scan locations"""
-        params = await self.get_scanner_params()
-        
-        locations = []
-        if isinstance(params, dict) and "location_tree" in params:
-            for location_group in params["location_tree"]:
-                if isinstance(location_group, dict) and "locations" in location_group:
-                    for location in location_group["locations"]:
-                        if isinstance(location, dict) and "type" in location:
-                            locations.append(location["type"])
-        
-        return locations
+        await self.get_scanner_params()
+        return list(self._locations)
     
-    def _parse_decimal(self, value: Any) -> Optional[Decimal]:
-        """Parse decimal value safely"""
-        if value is None:
-            return None
-        try:
-            return Decimal(str(value))
-        except (ValueError, TypeError):
-            return None
-    
-    def _parse_int(self, value: Any) -> Optional[int]:
-        """Parse integer value safely"""
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None 
\ No newline at end of file
+    # Kept as static aliases of the module-level parsers for API
+    # compatibility; run_scan calls the functions directly
+    _parse_decimal = staticmethod(_parse_decimal)
+    _parse_int = staticmethod(_parse_int) 
\ No newline at end of file
@@ -7,16 +7,24 @@ Run this script to see examples of different scan types in action.
 """
 
 import asyncio
+import io
 import logging
+import sys
 from typing import List
 from decimal import Decimal
 
 from .scanner import ScannerAdapter, ScanResult, ScanRequest
+from .._output import CAPTURE as _CAPTURE, StdoutRouter as _StdoutRouter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Result-table pieces prepared once at import (see pnl_demo)
+_SCAN_ROW_FMT = "{:<8} {:<30} {:<8} {:<8}".format
+_SCAN_HDR = _SCAN_ROW_FMT("Symbol", "Company", "Exchange", "SecType")
+_SCAN_RULE = f"{'-'*8} {'-'*30} {'-'*8} {'-'*8}"
+
 class ScannerDemo:
     """Demo class to showcase scanner functionality"""
     
@@ -25,31 +33,31 @@ class ScannerDemo:
     
     def print_scan_results(self, results: List[ScanResult], title: str):
         """Print scan results in a formatted table"""
-        print(f"\n{'='*80}")
-        print(f"{title}")
-        print(f"{'='*80}")
-        
+        # Assemble the whole table and emit it with one print, instead of
+        # taking the stdout lock once per row
+        lines = [f"\n{'='*80}", title, '='*80]
+
         if not results:
-            print("No results found.")
+            lines.append("No results found.")
+            print("\n".join(lines))
             return
-        
-        # Print header
-        print(f"{'Symbol':<8} {'Company':<30} {'Exchange':<8} {'SecType':<8}")
-        print(f"{'-'*8} {'-'*30} {'-'*8} {'-'*8}")
-        
-        # Print results
+
+        lines.append(_SCAN_HDR)
+        lines.append(_SCAN_RULE)
+
         for result in results[:10]:  # Show top 10 results
-            symbol = result.symbol or "N/A"
-            desc = (result.contractDesc or "N/A")[:30]
-            exchange = (result.exchange or "N/A")[:8]
-            sec_type = (result.secType or "N/A")[:8]
-            
-            print(f"{symbol:<8} {desc:<30} {exchange:<8} {sec_type:<8}")
-        
+            lines.append(_SCAN_ROW_FMT(
+                result.symbol or "N/A",
+                (result.contractDesc or "N/A")[:30],
+                (result.exchange or "N/A")[:8],
+                (result.secType or "N/A")[:8]
+            ))
+
         if len(results) > 10:
-            print(f"\n... and {len(results) - 10} more results")
-        
-        print(f"\nTotal results: {len(results)}")
+            lines.append(f"\n... and {len(results) - 10} more results")
+
+        lines.append(f"\nTotal results: {len(results)}")
+        print("\n".join(lines))
     
     async def demo_scanner_params(self):
         """Demo: Get scanner parameters and available options"""
@@ -179,15 +187,19 @@ class ScannerDemo:
             "STK.NYSE"         # NYSE
         ]
         
-        for location in locations_to_try:
-            try:
-                print(f"\n🔍 Scanning {location}...")
-                results = await self.scanner.top_gainers(max_results=5, location=location)
+        # Scan every location concurrently, then print in the listed order
+        results_by_location = await asyncio.gather(
+            *(self.scanner.top_gainers(max_results=5, location=location)
+              for location in locations_to_try),
+            return_exceptions=True
+        )
+        for location, results in zip(locations_to_try, results_by_location):
+            print(f"\n🔍 Scanning {location}...")
+            if isinstance(results, Exception):
+                print(f"❌ Error scanning {location}: {results}")
+                logger.error(f"Location scan error for {location}: {results}")
+            else:
                 self.print_scan_results(results, f"📈 TOP GAINERS - {location}")
-                
-            except Exception as e:
-                print(f"❌ Error scanning {location}: {e}")
-                logger.error(f"Location scan error for {location}: {e}")
     
     async def demo_available_scan_codes(self):
         """Demo: Show available scan codes"""
@@ -229,15 +241,32 @@ class ScannerDemo:
             print(f"❌ Error getting locations: {e}")
             logger.error(f"Locations error: {e}")
     
+    async def _run_buffered(self, demo_name: str, demo_func) -> str:
+        """Run one demo with its output captured in a private buffer"""
+        buf = io.StringIO()
+        token = _CAPTURE.set(buf)
+        try:
+            await demo_func()
+        except Exception as e:
+            buf.write(f"❌ {demo_name} failed: {e}\n")
+            logger.exception(f"Demo {demo_name} failed")
+        finally:
+            _CAPTURE.reset(token)
+        return buf.getvalue()
+
     async def run_all_demos(self):
         """Run all scanner demos"""
         print("🎬 Starting Scanner Demo Suite...")
         print("=" * 80)
-        
-        demos = [
+
+        # The metadata demos run first as a barrier: they warm the params
+        # cache the scan demos' locations/codes come from
+        meta_demos = [
             ("Scanner Parameters", self.demo_scanner_params),
-            ("Available Scan Codes", self.demo_available_scan_codes), 
+            ("Available Scan Codes", self.demo_available_scan_codes),
             ("Available Locations", self.demo_available_locations),
+        ]
+        scan_demos = [
             ("Top Gainers", self.demo_top_gainers),
             ("Top Losers", self.demo_top_losers),
             ("Most Active", self.demo_most_active),
@@ -245,18 +274,31 @@ class ScannerDemo:
             ("Custom Scan with Filters", self.demo_custom_scan_with_filters),
             ("Different Locations", self.demo_different_locations)
         ]
-        
-        for demo_name, demo_func in demos:
+
+        for demo_name, demo_func in meta_demos:
             try:
                 print(f"\n🚀 Running {demo_name}...")
                 await demo_func()
-                await asyncio.sleep(1)  # Brief pause between demos
-                
             except Exception as e:
                 print(f"❌ Demo '{demo_name}' failed: {e}")
                 logger.error(f"Demo '{demo_name}' failed: {e}")
-                continue
-        
+
+        # The scan demos hit independent endpoints, so their HTTP calls can
+        # overlap; each task writes to its own buffer and the output is
+        # replayed in order afterwards
+        router = _StdoutRouter(sys.stdout)
+        original_stdout, sys.stdout = sys.stdout, router
+        try:
+            outputs = await asyncio.gather(
+                *(self._run_buffered(name, func) for name, func in scan_demos)
+            )
+        finally:
+            sys.stdout = original_stdout
+
+        for (demo_name, _), output in zip(scan_demos, outputs):
+            print(f"\n🚀 Running {demo_name}...")
+            print(output, end="")
+
         print(f"\n🎉 Scanner Demo Suite Complete!")
         print("=" * 80)
 
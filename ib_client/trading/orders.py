@@ -1,14 +1,28 @@
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel
+from typing import AsyncIterator, List, Optional, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, field_validator
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
 import logging
+import re
 
 from ..core.session import SessionAdapter
 from ..core.http import _get, _post, _delete
 
+try:
+    import orjson
+except ImportError:  # matches core.http - bodies fall back to httpx's json kwarg
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Strips currency symbols and grouping from numeric strings; compiled once
+# instead of re-parsing the pattern on every _parse_decimal call
+_CLEAN_RE = re.compile(r'[^0-9.\-]')
+
+# Placeholder tokens the gateway uses for missing numeric values
+_NA_VALUES = frozenset(('n/a', 'na', '', '-'))
+
 class OrderSide(str, Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -35,6 +49,10 @@ class OrderStatus(str, Enum):
 
 class OrderRequest(BaseModel):
     """Order request model"""
+    # Frozen so the derived payload below can be computed once and cached
+    # on the instance
+    model_config = ConfigDict(frozen=True)
+
     conid: int
     orderType: OrderType
     side: OrderSide
@@ -45,6 +63,42 @@ class OrderRequest(BaseModel):
     outsideRTH: bool = False
     useAdaptive: bool = True
 
+    @cached_property
+    def ib_fields(self) -> Dict[str, Any]:
+        """IB payload dict with enum values and Decimals pre-converted.
+
+        Built once per instance; whatif, place_order and modify_order all
+        read the same dict, so callers must not mutate it.
+        """
+        payload = {
+            "conid": self.conid,
+            "orderType": self.orderType.value,
+            "side": self.side.value,
+            "quantity": float(self.quantity),
+            "tif": self.tif.value,
+            "outsideRTH": self.outsideRTH,
+            "useAdaptive": self.useAdaptive
+        }
+
+        # Add price fields if provided
+        if self.price is not None:
+            payload["price"] = float(self.price)
+        if self.auxPrice is not None:
+            payload["auxPrice"] = float(self.auxPrice)
+
+        return payload
+
+    @cached_property
+    def orders_body(self) -> Optional[bytes]:
+        """The {"orders": [...]} body pre-encoded with orjson.
+
+        None when orjson is unavailable; callers then hand ib_fields to
+        _post's json path instead.
+        """
+        if orjson is None:
+            return None
+        return orjson.dumps({"orders": [self.ib_fields]})
+
 class WhatIfResult(BaseModel):
     """What-if order preview result"""
     equity: Optional[Decimal] = None
@@ -62,15 +116,15 @@ class OrderResult(BaseModel):
 
 class LiveOrder(BaseModel):
     """Live order information"""
-    orderId: str
-    conid: int
+    orderId: str = ""
+    conid: int = 0
     symbol: Optional[str] = None
-    side: str
-    orderType: str
-    quantity: Decimal
+    side: str = ""
+    orderType: str = ""
+    quantity: Decimal = Decimal(0)
     price: Optional[Decimal] = None
     auxPrice: Optional[Decimal] = None
-    status: str
+    status: str = ""
     filled: Optional[Decimal] = None
     remaining: Optional[Decimal] = None
     avgPrice: Optional[Decimal] = None
@@ -79,37 +133,51 @@ class LiveOrder(BaseModel):
     timeInForce: Optional[str] = None
     account: Optional[str] = None
 
+    @field_validator("quantity", "price", "auxPrice", "filled", "remaining",
+                     "avgPrice", mode="before")
+    @classmethod
+    def clean_decimal(cls, value: Any) -> Any:
+        """Normalize the gateway's decimal formats before coercion.
+
+        Runs the cleanup that used to live in per-field _parse_decimal
+        calls inside validation, so a raw order dict can be validated in
+        one pass.
+        """
+        if value is None or isinstance(value, (int, float, Decimal)):
+            return value
+        if isinstance(value, dict):
+            # IB API format like {'amount': 1000.0, 'currency': 'USD'}
+            if 'amount' in value:
+                return value['amount']
+            if 'value' in value:
+                return value['value']
+            return None
+        str_value = str(value).strip()
+        if not str_value or str_value.lower() in ('n/a', 'na', '-'):
+            return None
+        clean_value = _CLEAN_RE.sub('', str_value)
+        if not clean_value or clean_value == '-':
+            return None
+        return clean_value
+
 class OrderAdapter(SessionAdapter):
     """Adapter for order management with risk preview and execution"""
-    
+
     def __init__(self):
         super().__init__()
-    
+
     async def whatif(self, account: str, order: OrderRequest) -> WhatIfResult:
         """Get what-if order preview for risk assessment"""
         await self._ensure_live()
-        
+
         try:
-            order_data = {
-                "orders": [{
-                    "conid": order.conid,
-                    "orderType": order.orderType.value,
-                    "side": order.side.value,
-                    "quantity": float(order.quantity),
-                    "tif": order.tif.value,
-                    "outsideRTH": order.outsideRTH,
-                    "useAdaptive": order.useAdaptive
-                }]
-            }
-            
-            # Add price fields if provided
-            if order.price is not None:
-                order_data["orders"][0]["price"] = float(order.price)
-            if order.auxPrice is not None:
-                order_data["orders"][0]["auxPrice"] = float(order.auxPrice)
-            
-            data = await _post(f"/iserver/account/{account}/orders/whatif", 
-                             json_data=order_data)
+            # ib_fields/orders_body are cached on the order, so place_order's
+            # preview and placement share one payload and one encode
+            body = order.orders_body
+
+            data = await _post(f"/iserver/account/{account}/orders/whatif",
+                             json_data=None if body is not None else {"orders": [order.ib_fields]},
+                             content=body)
             
             logger.debug(f"What-if result for account {account}: {data}")
             
@@ -145,36 +213,23 @@ class OrderAdapter(SessionAdapter):
         Recommended to use what-if preview for risk checks.
         """
         await self._ensure_live()
-        
-        # Optional what-if check first
+
+        # Optional what-if check first. Deliberately kept causal - the
+        # preview must be inspected before money moves, so the two POSTs
+        # are not raced. Payload and encoded body are cached on the order,
+        # so the preview and the placement share both
         if not skip_whatif:
             whatif_result = await self.whatif(account, order)
             if whatif_result.error:
                 raise ValueError(f"What-if preview failed: {whatif_result.error}")
             if whatif_result.warn:
                 logger.warning(f"What-if warning: {whatif_result.warn}")
-        
+
         try:
-            order_data = {
-                "orders": [{
-                    "conid": order.conid,
-                    "orderType": order.orderType.value,
-                    "side": order.side.value,
-                    "quantity": float(order.quantity),
-                    "tif": order.tif.value,
-                    "outsideRTH": order.outsideRTH,
-                    "useAdaptive": order.useAdaptive
-                }]
-            }
-            
-            # Add price fields if provided
-            if order.price is not None:
-                order_data["orders"][0]["price"] = float(order.price)
-            if order.auxPrice is not None:
-                order_data["orders"][0]["auxPrice"] = float(order.auxPrice)
-            
-            data = await _post(f"/iserver/account/{account}/orders", 
-                             json_data=order_data)
+            body = order.orders_body
+            data = await _post(f"/iserver/account/{account}/orders",
+                             json_data=None if body is not None else {"orders": [order.ib_fields]},
+                             content=body)
             
             logger.debug(f"Order placement result for account {account}: {data}")
             
@@ -210,52 +265,47 @@ class OrderAdapter(SessionAdapter):
             logger.error(f"Failed to cancel order {order_id} for account {account}: {e}")
             raise
     
-    async def get_live_orders(self) -> List[LiveOrder]:
-        """Get all live orders across accounts"""
+    async def iter_live_orders(self) -> AsyncIterator[LiveOrder]:
+        """Yield live orders across accounts as they are parsed.
+
+        The response is fetched once; each order is parsed and yielded
+        individually so callers can process incrementally instead of
+        holding every LiveOrder at once.
+        """
         await self._ensure_live()
-        
+
         try:
             data = await _get("/iserver/account/orders")
             logger.debug(f"Live orders data: {data}")
-            
-            live_orders = []
-            if isinstance(data, dict) and "orders" in data:
-                orders_data = data["orders"]
-            elif isinstance(data, list):
-                orders_data = data
-            else:
-                orders_data = []
-            
-            for order_data in orders_data:
-                try:
-                    live_order = LiveOrder(
-                        orderId=order_data.get("orderId", ""),
-                        conid=order_data.get("conid", 0),
-                        symbol=order_data.get("symbol"),
-                        side=order_data.get("side", ""),
-                        orderType=order_data.get("orderType", ""),
-                        quantity=Decimal(str(order_data.get("quantity", 0))),
-                        price=self._parse_decimal(order_data.get("price")),
-                        auxPrice=self._parse_decimal(order_data.get("auxPrice")),
-                        status=order_data.get("status", ""),
-                        filled=self._parse_decimal(order_data.get("filled")),
-                        remaining=self._parse_decimal(order_data.get("remaining")),
-                        avgPrice=self._parse_decimal(order_data.get("avgPrice")),
-                        lastExecutionTime=order_data.get("lastExecutionTime"),
-                        orderRef=order_data.get("orderRef"),
-                        timeInForce=order_data.get("timeInForce"),
-                        account=order_data.get("account")
-                    )
-                    live_orders.append(live_order)
-                except Exception as e:
-                    logger.warning(f"Failed to parse live order data: {order_data}, error: {e}")
-            
-            logger.info(f"Found {len(live_orders)} live orders")
-            return live_orders
-            
         except Exception as e:
             logger.error(f"Failed to get live orders: {e}")
             raise
+
+        if isinstance(data, dict) and "orders" in data:
+            orders_data = data["orders"]
+        elif isinstance(data, list):
+            orders_data = data
+        else:
+            orders_data = []
+
+        count = 0
+        for order_data in orders_data:
+            try:
+                # The before-validator on LiveOrder handles decimal cleanup,
+                # so the raw row validates in one pass instead of a
+                # per-field _parse_decimal fan-out
+                live_order = LiveOrder.model_validate(order_data)
+            except Exception as e:
+                logger.warning(f"Failed to parse live order data: {order_data}, error: {e}")
+                continue
+            count += 1
+            yield live_order
+
+        logger.info(f"Found {count} live orders")
+
+    async def get_live_orders(self) -> List[LiveOrder]:
+        """Get all live orders across accounts"""
+        return [order async for order in self.iter_live_orders()]
     
     async def get_order_status(self, order_id: str) -> dict:
         """Get status of a specific order"""
@@ -275,24 +325,8 @@ class OrderAdapter(SessionAdapter):
         await self._ensure_live()
         
         try:
-            order_data = {
-                "conid": order.conid,
-                "orderType": order.orderType.value,
-                "side": order.side.value,
-                "quantity": float(order.quantity),
-                "tif": order.tif.value,
-                "outsideRTH": order.outsideRTH,
-                "useAdaptive": order.useAdaptive
-            }
-            
-            # Add price fields if provided
-            if order.price is not None:
-                order_data["price"] = float(order.price)
-            if order.auxPrice is not None:
-                order_data["auxPrice"] = float(order.auxPrice)
-            
-            data = await _post(f"/iserver/account/{account}/order/{order_id}", 
-                             json_data=order_data)
+            data = await _post(f"/iserver/account/{account}/order/{order_id}",
+                             json_data=order.ib_fields)
             
             logger.info(f"Order {order_id} modified for account {account}")
             
@@ -316,6 +350,11 @@ class OrderAdapter(SessionAdapter):
         """Parse decimal value from various formats"""
         if value is None:
             return None
+        # Fast path: numeric values need no placeholder or formatting
+        # handling at all (exact type checks keep bools on the slow path)
+        kind = type(value)
+        if kind is int or kind is float:
+            return Decimal(repr(value))
         try:
             # Handle different value formats from IB API
             if isinstance(value, dict):
@@ -324,20 +363,19 @@ class OrderAdapter(SessionAdapter):
                     return Decimal(str(value['amount']))
                 elif 'value' in value:
                     return Decimal(str(value['value']))
-            
+
             # Handle string/numeric values
             str_value = str(value).strip()
-            if not str_value or str_value.lower() in ('n/a', 'na', '', '-'):
+            if not str_value or str_value.lower() in _NA_VALUES:
                 return None
-            
+
             # Remove currency symbols and other formatting
-            import re
-            clean_value = re.sub(r'[^0-9.\-]', '', str_value)
+            clean_value = _CLEAN_RE.sub('', str_value)
             if not clean_value or clean_value == '-':
                 return None
-                
+
             return Decimal(clean_value)
-            
+
         except (ValueError, TypeError, Exception) as e:
             logger.warning(f"Could not parse decimal value: {value}, error: {e}")
-            return None 
\ No newline at end of file
+            return None
\ No newline at end of file
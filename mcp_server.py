@@ -1,7 +1,9 @@
 # server.py
 from fastmcp import FastMCP
 from typing import Optional, List
+import asyncio
 import logging
+import time
 
 from ib_client import (
     IBClient, search_contract, 
@@ -20,6 +22,25 @@ mcp = FastMCP(
 # Global client instance
 client = IBClient()
 
+# Symbol -> conid mappings are stable, and parallel agents often resolve the
+# same symbol at once. Concurrent identical lookups share one in-flight
+# future (single-flight) and repeats within the TTL reuse its result.
+_CONTRACT_TTL = 60.0
+_contract_cache: dict = {}  # (SYMBOL, SEC_TYPE) -> (expires_at, future)
+
+async def _cached_search_contract(symbol: str, sec_type: str):
+    key = (symbol.upper(), sec_type.upper())
+    entry = _contract_cache.get(key)
+    if entry is not None:
+        expires_at, future = entry
+        # Failed lookups are not reused
+        if time.monotonic() < expires_at and not (future.done() and future.exception() is not None):
+            return await asyncio.shield(future)
+
+    future = asyncio.ensure_future(search_contract(symbol, sec_type))
+    _contract_cache[key] = (time.monotonic() + _CONTRACT_TTL, future)
+    return await asyncio.shield(future)
+
 
 # ============================================================================
 # REFERENCE & CONTRACT TOOLS
@@ -29,7 +50,7 @@ client = IBClient()
 async def find_contract(symbol: str, sec_type: str = "STK") -> dict:
     """Resolve symbol → IB contract with conid, exchange info."""
     try:
-        contract = await search_contract(symbol, sec_type)
+        contract = await _cached_search_contract(symbol, sec_type)
         return contract.model_dump()
     except ValueError as e:
         # Handle expected validation errors (invalid symbols, etc.)
@@ -76,15 +97,20 @@ async def get_positions(account_id: Optional[str] = None, max_positions: int = 5
         if not account_id:
             account_id = await client.get_primary_account()
         
-        positions = await client.portfolio.all_positions(account_id)
-        
-        # Limit results and convert to dict
-        limited_positions = positions[:max_positions]
+        # Stream pages and stop at max_positions, so oversized accounts
+        # don't pay for pages (or models) past the requested cap
+        positions = []
+        truncated = False
+        async for pos in client.portfolio.iter_positions(account_id):
+            if len(positions) >= max_positions:
+                truncated = True
+                break
+            positions.append(pos.model_dump())
         return {
             "account_id": account_id,
-            "positions": [pos.model_dump() for pos in limited_positions],
-            "count": len(limited_positions),
-            "total_positions": len(positions)
+            "positions": positions,
+            "count": len(positions),
+            "truncated": truncated
         }
     except Exception as e:
         return {"error": f"Failed to get positions: {str(e)}"}
@@ -117,6 +143,52 @@ async def get_ledger(account_id: Optional[str] = None) -> dict:
     except Exception as e:
         return {"error": f"Failed to get ledger: {str(e)}"}
 
+@mcp.tool(tags=["portfolio"])
+async def get_portfolio_overview(account_id: Optional[str] = None, max_positions: int = 50) -> dict:
+    """Get summary, positions, P&L and ledger in one combined call."""
+    try:
+        if not account_id:
+            account_id = await client.get_primary_account()
+
+        # The four endpoints are independent; fan out so the tool costs one
+        # round trip instead of four. Sections fail individually.
+        summary, positions, pnl_data, ledger = await asyncio.gather(
+            client.portfolio.summary(account_id),
+            client.portfolio.all_positions(account_id),
+            client.pnl.get_partitioned_pnl(),
+            client.portfolio.ledger(account_id),
+            return_exceptions=True
+        )
+
+        overview: dict = {"account_id": account_id}
+
+        if isinstance(summary, BaseException):
+            overview["summary_error"] = str(summary)
+        else:
+            overview["summary"] = summary.model_dump()
+
+        if isinstance(positions, BaseException):
+            overview["positions_error"] = str(positions)
+        else:
+            limited_positions = positions[:max_positions]
+            overview["positions"] = [pos.model_dump() for pos in limited_positions]
+            overview["position_count"] = len(limited_positions)
+            overview["total_positions"] = len(positions)
+
+        if isinstance(pnl_data, BaseException):
+            overview["pnl_error"] = str(pnl_data)
+        else:
+            overview["pnl"] = [pnl.model_dump() for pnl in pnl_data]
+
+        if isinstance(ledger, BaseException):
+            overview["ledger_error"] = str(ledger)
+        else:
+            overview["ledger"] = [line.model_dump() for line in ledger]
+
+        return overview
+    except Exception as e:
+        return {"error": f"Failed to get portfolio overview: {str(e)}"}
+
 # ============================================================================
 # MARKET DATA TOOLS
 # ============================================================================
@@ -137,12 +209,16 @@ async def get_market_snapshot(conid: int) -> dict:
 async def get_history(conid: int, bar: str = "1d", period: str = "1m", outside_rth: bool = True) -> dict:
     """Fetch OHLCV historical bars."""
     try:
-        bars = await client.market_data.history(conid, bar, period, outside_rth)
+        # Stream bars and dump each as it arrives, so only the serialized
+        # dicts are held rather than dicts plus a second bar list
+        bars = []
+        async for hist_bar in client.market_data.iter_history(conid, bar, period, outside_rth):
+            bars.append(hist_bar.model_dump())
         return {
             "conid": conid,
             "bar": bar,
             "period": period,
-            "bars": [bar.model_dump() for bar in bars],
+            "bars": bars,
             "count": len(bars)
         }
     except Exception as e:
@@ -384,8 +460,8 @@ async def portfolio_health_check(account_id: Optional[str] = None) -> dict:
 async def stock_analysis(symbol: str, target_quantity: int = 100) -> dict:
     """Complete stock analysis combining market data, portfolio context, and risk assessment."""
     try:
-        # Find contract
-        contract = await search_contract(symbol)
+        # Find contract (shares the find_contract cache)
+        contract = await _cached_search_contract(symbol, "STK")
         
         # Get market data
         snapshot = await client.market_data.snapshot(contract.conid)